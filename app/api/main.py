@@ -2,9 +2,10 @@
 OpenManus API - Clean Architecture Implementation
 """
 
+import json
 import logging
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import routers
@@ -15,6 +16,9 @@ from app.api.v1 import api_router as api_v1_router
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Serialized once; the legacy health probe is polled by launch/test scripts
+_LEGACY_HEALTH_BYTES = json.dumps({"status": "healthy", "version": "2.0.0"}).encode()
+
 
 def create_app() -> FastAPI:
     """Create FastAPI application with clean architecture"""
@@ -63,7 +67,7 @@ def create_app() -> FastAPI:
     @app.get("/health")
     async def health_legacy():
         """Legacy health endpoint for backward compatibility"""
-        return {"status": "healthy", "version": "2.0.0"}
+        return Response(content=_LEGACY_HEALTH_BYTES, media_type="application/json")
 
     @app.get("/dashboard/stats")
     async def dashboard_stats_legacy():
@@ -85,4 +89,5 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)  # nosec
+    # Broadcast-heavy WebSocket traffic: skip per-connection permessage-deflate
+    uvicorn.run(app, host="0.0.0.0", port=8000, ws_per_message_deflate=False)  # nosec
@@ -187,7 +187,8 @@ O OpenManus é um sistema multi-agente que executa tarefas complexas:
         else:
             # Tarefa real - executar com agentes
             logger.info(f"Processando tarefa: {request.message}")
-            logger.info(f"Análise de complexidade: {task_analysis}")
+            # Score e indicadores são parciais (a análise para no limiar), só a decisão é registrada
+            logger.info(f"Análise de complexidade: is_complex={task_analysis['is_complex']}")
 
             # Criar agente Manus
             manus_agent = await Manus.create()
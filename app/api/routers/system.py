@@ -1,32 +1,44 @@
 """System and health API router"""
 
-from fastapi import APIRouter, Depends
+import json
+
+from fastapi import APIRouter, Depends, Response
 
 from app.api.dependencies.core import get_task_service
 from app.services.task_service import TaskService
 
 router = APIRouter(prefix="/system", tags=["system"])
 
-
-@router.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
+# Static payloads are serialized once at import and served as raw bytes,
+# skipping FastAPI's per-request encoding on these hot polling endpoints
+_HEALTH_BYTES = json.dumps(
+    {
         "status": "healthy",
         "version": "2.0.0",
         "message": "OpenManus API is running",
     }
+).encode()
 
-
-@router.get("/info")
-async def get_info():
-    """System information"""
-    return {
+_INFO_BYTES = json.dumps(
+    {
         "name": "OpenManus API",
         "version": "2.0.0",
         "description": "AI Assistant Backend API with Clean Architecture",
         "architecture": "Layered Architecture with DDD patterns",
     }
+).encode()
+
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+@router.get("/info")
+async def get_info():
+    """System information"""
+    return Response(content=_INFO_BYTES, media_type="application/json")
 
 
 @router.get("/dashboard/stats")
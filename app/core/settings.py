@@ -6,6 +6,8 @@ with support for TOML files and environment variables. It replaces the dispersed
 configuration loading across the application.
 """
 
+import copy
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -31,6 +33,23 @@ PROJECT_ROOT = get_project_root()
 ENVIRONMENT = get_environment()
 
 
+@lru_cache(maxsize=8)
+def _parse_toml_file(path: Path, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    """Parse a TOML file; the unused stat arguments key the cache, so it is reparsed when they change."""
+    with path.open("rb") as f:
+        return tomllib.load(f)
+
+
+def _read_toml_file(path: Path) -> dict[str, Any] | None:
+    """Return a private copy of a parsed TOML file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    # Copy so merging and callers never mutate the cached document
+    return copy.deepcopy(_parse_toml_file(path, stat.st_mtime_ns, stat.st_size))
+
+
 class ProxySettings(BaseModel):
     """Proxy configuration settings."""
 
@@ -404,29 +423,25 @@ class Settings(BaseSettings):
     # Configuration Loading Methods
     # ===============================
     def _load_toml_config(self) -> dict[str, Any]:
-        """Load configuration from TOML files."""
+        """Load configuration from TOML files (parsed once per file version)."""
         config_data = {}
 
         # Load base configuration
-        base_config_path = self.config_dir / "config.toml"
-        if base_config_path.exists():
-            with base_config_path.open("rb") as f:
-                config_data.update(tomllib.load(f))
+        base_config = _read_toml_file(self.config_dir / "config.toml")
+        if base_config is not None:
+            config_data.update(base_config)
 
         # Load environment-specific configuration
-        env_config_path = self.config_dir / f"{self.environment}.toml"
-        if env_config_path.exists():
-            with env_config_path.open("rb") as f:
-                env_config = tomllib.load(f)
-                # Merge environment config over base config
-                self._deep_merge_dict(config_data, env_config)
+        env_config = _read_toml_file(self.config_dir / f"{self.environment}.toml")
+        if env_config is not None:
+            # Merge environment config over base config
+            self._deep_merge_dict(config_data, env_config)
 
         # Load example config as fallback
         if not config_data:
-            example_config_path = self.config_dir / "examples" / "config.example.toml"
-            if example_config_path.exists():
-                with example_config_path.open("rb") as f:
-                    config_data.update(tomllib.load(f))
+            example_config = _read_toml_file(self.config_dir / "examples" / "config.example.toml")
+            if example_config is not None:
+                config_data.update(example_config)
 
         return config_data
 
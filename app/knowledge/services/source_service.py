@@ -60,6 +60,9 @@ class SourceService:
         "audio/webm",  # webm
     }
 
+    # Upper bound on documents extracted/embedded concurrently in the background
+    MAX_CONCURRENT_PROCESSING: ClassVar[int] = 4
+
     AUDIO_EXTENSIONS: ClassVar = {
         ".mp3",
         ".wav",
@@ -97,6 +100,11 @@ class SourceService:
         self.upload_dir = upload_dir or settings.upload_dir
         self.ensure_upload_dir_exists()
 
+        # Strong references to in-flight processing tasks so they are not
+        # garbage-collected mid-run, plus a cap on how many run at once
+        self._background_tasks: set[asyncio.Task] = set()
+        self._processing_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PROCESSING)
+
         # Configure OpenAI client for audio transcription if key provided
         self.openai_client = None
         if openai_api_key:
@@ -322,6 +330,18 @@ class SourceService:
             logger.error(f"Hash computation failed: {e!s}")
             raise SourceServiceError(f"Hash computation failed: {e!s}") from e
 
+    @staticmethod
+    def _write_all(source: BinaryIO, file_path: Path) -> int:
+        """Copy a file object to disk in 1MB chunks, preserving its position."""
+        pos = source.tell()
+        source.seek(0)
+        try:
+            with file_path.open("wb") as f:
+                shutil.copyfileobj(source, f, 1024 * 1024)
+                return f.tell()
+        finally:
+            source.seek(pos)
+
     async def _save_uploaded_file(
         self, upload_file: UploadFile, dest_dir: str, filename: str | None = None
     ) -> tuple[str, int]:
@@ -351,22 +371,8 @@ class SourceService:
 
             file_path = Path(dest_dir) / filename
 
-            # Save file
-            async with aiofiles.open(file_path, "wb") as f:
-                # Get current position
-                pos = upload_file.file.tell()
-                # Go back to beginning
-                upload_file.file.seek(0)
-
-                # Copy in chunks
-                while chunk := upload_file.file.read(1024 * 1024):  # 1MB chunks
-                    await f.write(chunk)
-
-                # Restore position
-                upload_file.file.seek(pos)
-
-            # Get file size
-            file_size = Path(file_path).stat().st_size
+            # Save file in a single worker-thread hop rather than one per chunk
+            file_size = await asyncio.to_thread(self._write_all, upload_file.file, file_path)
 
             logger.info(f"Saved uploaded file: {file_path} ({file_size} bytes)")
             return file_path, file_size
@@ -590,7 +596,9 @@ class SourceService:
             logger.info(f"Created source document: {source_id}")
 
             # Start processing in background - intentionally not awaited
-            asyncio.create_task(self._process_document(source_doc))  # noqa: RUF006
+            task = asyncio.create_task(self._process_document_limited(source_doc))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
 
             return source_doc
 
@@ -601,6 +609,11 @@ class SourceService:
             logger.error(f"Unexpected error in upload_source: {e!s}")
             raise SourceServiceError(f"Unexpected error during upload: {e!s}") from e
 
+    async def _process_document_limited(self, source_doc: SourceDocument) -> None:
+        """Process a source document once a background processing slot is free."""
+        async with self._processing_semaphore:
+            await self._process_document(source_doc)
+
     async def _process_document(self, source_doc: SourceDocument) -> None:
         """
         Process a source document in the background.
@@ -1,6 +1,7 @@
 """Task service - Business logic layer"""
 
 from datetime import datetime
+import re
 from typing import Any
 
 from app.domain.entities import Task, TaskComplexity, TaskMode, TaskStatus
@@ -11,6 +12,12 @@ from app.infrastructure.messaging.event_bus import (
 )
 from app.repositories.interfaces import TaskRepository
 
+# Complexity indicator vocabularies, compiled once so each category is a single
+# substring scan over the description instead of a Python loop per keyword.
+_KEYWORD_RE = re.compile("multiple|several|many|complex|analyze|research|coordinate|integrate|comprehensive")
+_DOMAIN_RE = re.compile("file|web|database|api|document|image|data|report|chart")
+_TIME_RE = re.compile("detailed|thorough|extensive|complete|full")
+
 
 class ComplexityAnalysisService:
     """Service for analyzing task complexity"""
@@ -21,37 +28,9 @@ class ComplexityAnalysisService:
 
         indicators = {
             "length": len(description) > 100,
-            "keywords": any(
-                keyword in description_lower
-                for keyword in [
-                    "multiple",
-                    "several",
-                    "many",
-                    "complex",
-                    "analyze",
-                    "research",
-                    "coordinate",
-                    "integrate",
-                    "comprehensive",
-                ]
-            ),
-            "multipleDomains": any(
-                domain in description_lower
-                for domain in [
-                    "file",
-                    "web",
-                    "database",
-                    "api",
-                    "document",
-                    "image",
-                    "data",
-                    "report",
-                    "chart",
-                ]
-            ),
-            "timeConsuming": any(
-                phrase in description_lower for phrase in ["detailed", "thorough", "extensive", "complete", "full"]
-            ),
+            "keywords": bool(_KEYWORD_RE.search(description_lower)),
+            "multipleDomains": bool(_DOMAIN_RE.search(description_lower)),
+            "timeConsuming": bool(_TIME_RE.search(description_lower)),
         }
 
         score = sum(indicators.values()) / len(indicators)
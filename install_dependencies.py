@@ -16,63 +16,217 @@ Opções:
     --all               Instala tudo (equivale ao requirements.txt original)
     --list              Lista módulos disponíveis
     --dry-run           Mostra o que seria instalado sem instalar
+    --per-module        Instala cada módulo em um pip separado (em paralelo)
+    --force-reinstall   Reinstala tudo, mesmo o que já está instalado
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import importlib.metadata
+import os
 from pathlib import Path
+import re
 import subprocess
 import sys
+import tempfile
+from types import MappingProxyType
+
+# Número de dependências do requirements.txt original (monolítico)
+BASELINE_DEPENDENCIES = 71
+
+# Limite de processos pip simultâneos no modo --per-module
+MAX_PARALLEL_INSTALLS = 4
+
+# Nome do projeto no início de um especificador PEP 508 (ex.: "duckduckgo_search~=8.0")
+_PROJECT_NAME_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)")
+# Requirement dado por URL direta (ex.: "git+https://...", "https://.../pacote.whl")
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://")
+
+
+@functools.lru_cache(maxsize=1)
+def pip_supports_fast_deps():
+    """Verifica (uma vez) se o pip instalado aceita --use-feature=fast-deps."""
+    # Com uma feature desconhecida o pip falha na validação antes de exibir a ajuda
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--use-feature=fast-deps", "--help"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return result.returncode == 0
+
+
+@functools.cache
+def resolve_requirements_files(project_root, file_names):
+    """Separa (uma vez por combinação) os arquivos de requirements existentes dos ausentes."""
+    found, missing = [], []
+    for name in file_names:
+        file_path = project_root / name
+        (found if file_path.exists() else missing).append(file_path)
+    return tuple(found), tuple(missing)
+
+
+def canonicalize_name(name):
+    """Normaliza o nome de um pacote conforme a PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def requirement_key(line):
+    """
+    Separa uma linha de requirements em (chave, especificador de versão).
+
+    A chave é o nome canônico do projeto com seus extras e marcador, de modo
+    que "pkg[extra]" e "pkg; python_version < '3.12'" não colidem com "pkg".
+    Opções do pip, URLs diretas e caminhos locais são identificados pela
+    linha inteira.
+    """
+    match = _PROJECT_NAME_RE.match(line)
+    if match is None or line.startswith("-") or _URL_RE.match(line):
+        return line, ""
+
+    rest = line[match.end() :].replace(" ", "")
+    extras = ""
+    if rest.startswith("["):
+        names, _, rest = rest[1:].partition("]")
+        extras = "[" + ",".join(sorted(canonicalize_name(name) for name in names.split(",") if name)) + "]"
+    spec, _, marker = rest.partition(";")
+
+    key = canonicalize_name(match.group(1)) + extras
+    if marker:
+        key += ";" + marker
+    return key, spec
+
+
+def merge_requirements(files):
+    """
+    Junta os arquivos de requirements em uma lista sem duplicatas.
+
+    A chave vem de requirement_key; a primeira ocorrência prevalece e
+    especificadores divergentes são reportados. Opções do pip (linhas com "-")
+    e URLs são mantidas uma única vez.
+    """
+    merged = {}
+    for file_path in files:
+        for raw_line in file_path.read_text(encoding="utf-8").splitlines():
+            line = raw_line.split(" #", 1)[0].strip()
+            if not line or line.startswith("#"):
+                continue
+
+            key, spec = requirement_key(line)
+            if key not in merged:
+                merged[key] = (line, spec)
+            elif merged[key][1] != spec:
+                print(f"⚠️  Conflito em {file_path.name}: '{line}' ignorado, mantendo '{merged[key][0]}'")
+
+    return [line for line, _ in merged.values()]
+
+
+def installed_versions():
+    """Mapeia nome canônico -> versão de cada distribuição instalada no interpretador atual."""
+    versions = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            versions.setdefault(canonicalize_name(name), dist.version)
+    return versions
+
+
+def pending_requirements(requirements):
+    """
+    Remove os requirements já satisfeitos pelo ambiente atual.
+
+    Requer o pacote packaging; sem ele a lista é devolvida intacta e o pip
+    decide. Requirements com extras ou URL direta ("pkg @ git+https://...")
+    são sempre mantidos, pois não é possível verificar se os extras ou a
+    origem instalada correspondem. Opções do pip só são mantidas se restar
+    algum pacote a instalar.
+    """
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        return requirements
+
+    installed = installed_versions()
+    options, pending = [], []
+    for line in requirements:
+        if line.startswith("-"):
+            options.append(line)
+            continue
+
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            pending.append(line)
+            continue
+
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+
+        version = installed.get(canonicalize_name(requirement.name))
+        if (
+            version is None
+            or requirement.extras
+            or requirement.url
+            or not requirement.specifier.contains(version, prereleases=True)
+        ):
+            pending.append(line)
+
+    return [*options, *pending] if pending else []
 
 
 class ModularInstaller:
     def __init__(self):
         self.project_root = Path(__file__).parent
-        self.modules = {
-            "core": {
-                "file": "requirements-core.txt",
-                "description": "Dependências essenciais (FastAPI, OpenAI, etc.)",
-                "dependencies": 19,
-            },
-            "features": {
-                "file": "requirements-features.txt",
-                "description": "Funcionalidades avançadas (embeddings, sandbox, etc.)",
-                "dependencies": 10,
-            },
-            "documents": {
-                "file": "requirements-documents.txt",
-                "description": "Processamento avançado de documentos",
-                "dependencies": 6,
-            },
-            "search": {
-                "file": "requirements-search.txt",
-                "description": "Motores de busca (Google, Baidu, DuckDuckGo)",
-                "dependencies": 3,
-            },
-            "browser": {
-                "file": "requirements-browser.txt",
-                "description": "Automação de browser",
-                "dependencies": 1,
-            },
-        }
+        self.modules = MappingProxyType(
+            {
+                "core": {
+                    "file": "requirements-core.txt",
+                    "description": "Dependências essenciais (FastAPI, OpenAI, etc.)",
+                    "dependencies": 19,
+                },
+                "features": {
+                    "file": "requirements-features.txt",
+                    "description": "Funcionalidades avançadas (embeddings, sandbox, etc.)",
+                    "dependencies": 10,
+                },
+                "documents": {
+                    "file": "requirements-documents.txt",
+                    "description": "Processamento avançado de documentos",
+                    "dependencies": 6,
+                },
+                "search": {
+                    "file": "requirements-search.txt",
+                    "description": "Motores de busca (Google, Baidu, DuckDuckGo)",
+                    "dependencies": 3,
+                },
+                "browser": {
+                    "file": "requirements-browser.txt",
+                    "description": "Automação de browser",
+                    "dependencies": 1,
+                },
+            }
+        )
+
+        # Totais fixos calculados uma vez (os módulos não mudam após a construção)
+        self._total_deps = sum(info["dependencies"] for info in self.modules.values())
+        self._reduction = (BASELINE_DEPENDENCIES - self._total_deps) / BASELINE_DEPENDENCIES * 100
 
     def list_modules(self):
         """Lista todos os módulos disponíveis."""
         print("📦 Módulos disponíveis:")
         print("=" * 50)
 
-        total_deps = 0
         for name, info in self.modules.items():
             print(f"🔹 {name.upper()}")
             print(f"   Descrição: {info['description']}")
             print(f"   Dependências: {info['dependencies']}")
             print(f"   Arquivo: {info['file']}")
             print()
-            total_deps += info["dependencies"]
 
-        print(f"Total máximo de dependências: {total_deps}")
-        print("\nVs. requirements.txt original: 71 dependências")
-        reduction = ((71 - total_deps) / 71) * 100
-        print(f"Redução potencial: {71 - total_deps} dependências ({reduction:.1f}%)")
+        print(f"Total máximo de dependências: {self._total_deps}")
+        print(f"\nVs. requirements.txt original: {BASELINE_DEPENDENCIES} dependências")
+        print(f"Redução potencial: {BASELINE_DEPENDENCIES - self._total_deps} dependências ({self._reduction:.1f}%)")
 
     def validate_modules(self, modules):
         """Valida se os módulos existem."""
@@ -88,17 +242,61 @@ class ModularInstaller:
 
     def get_requirements_files(self, modules):
         """Retorna lista de arquivos de requirements para os módulos."""
-        files = []
-        for module in modules:
-            file_path = self.project_root / self.modules[module]["file"]
-            if file_path.exists():
-                files.append(file_path)
-            else:
-                print(f"⚠️  Arquivo não encontrado: {file_path}")
-
-        return files
-
-    def install_modules(self, modules, dry_run=False):
+        file_names = tuple(self.modules[module]["file"] for module in modules)
+        files, missing = resolve_requirements_files(self.project_root, file_names)
+        for file_path in missing:
+            print(f"⚠️  Arquivo não encontrado: {file_path}")
+
+        return list(files)
+
+    def _install_per_module(self, pip_cmd, files, env):
+        """Instala cada arquivo em um pip separado, em paralelo; retorna True se todos passarem."""
+
+        def install(file_path):
+            # stdout vai direto ao terminal (progresso em tempo real, sem buffer em
+            # memória); apenas stderr é capturado para o relatório de erro
+            return subprocess.run(
+                [*pip_cmd, "-r", str(file_path)],
+                check=True,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+
+        # O primeiro arquivo (normalmente core) é instalado sozinho para que as
+        # instalações paralelas não disputem as mesmas dependências base
+        first, *rest = files
+        success = True
+        with ThreadPoolExecutor(max_workers=max(1, min(len(rest), MAX_PARALLEL_INSTALLS))) as executor:
+            for batch in ([first], rest):
+                futures = {executor.submit(install, file_path): file_path for file_path in batch}
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        future.result()
+                        print(f"✅ {file_path.name} instalado com sucesso")
+                    except subprocess.CalledProcessError as e:
+                        print(f"❌ Erro ao instalar {file_path.name}:")
+                        print(e.stderr)
+                        success = False
+                if not success:
+                    break
+
+        return success
+
+    def _install_batch(self, pip_cmd, requirements, env):
+        """Instala a lista de requirements em uma única chamada ao pip; retorna True em caso de sucesso."""
+        # Arquivo temporário em vez de stdin: "-r /dev/stdin" não existe no Windows
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as merged_file:
+            merged_file.write("\n".join(requirements) + "\n")
+        try:
+            # Saída do pip não é capturada para exibir o progresso em tempo real
+            result = subprocess.run([*pip_cmd, "-r", merged_file.name], env=env, check=False)
+        finally:
+            Path(merged_file.name).unlink(missing_ok=True)
+        return result.returncode == 0
+
+    def install_modules(self, modules, dry_run=False, batch=True, force_reinstall=False):
         """Instala os módulos especificados."""
         if not modules:
             print("❌ Nenhum módulo especificado")
@@ -125,40 +323,68 @@ class ModularInstaller:
 
         print()
 
+        # Uma única chamada ao pip com os requirements já deduplicados: menos
+        # especificadores para o resolver e o pip só é iniciado uma vez
+        requirements = merge_requirements(files) if batch else []
+        if batch and not force_reinstall:
+            # Evita iniciar o pip quando tudo já está instalado na versão exigida
+            requirements = pending_requirements(requirements)
+            if not requirements:
+                print("✅ Nada a fazer: todas as dependências já estão instaladas")
+                return
+
         if dry_run:
-            print("🔍 DRY RUN - Comandos que seriam executados:")
-            for file_path in files:
-                print(f"   pip install -r {file_path}")
+            if batch:
+                print(f"🔍 DRY RUN - pip install com {len(requirements)} requirements pendentes:")
+                for requirement in requirements:
+                    print(f"   {requirement}")
+            else:
+                print("🔍 DRY RUN - Comandos que seriam executados:")
+                for file_path in files:
+                    print(f"   pip install -r {file_path}")
             return
 
-        # Instalar cada arquivo de requirements
-        for file_path in files:
-            print(f"📦 Instalando {file_path.name}...")
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-r", str(file_path)],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                print(f"✅ {file_path.name} instalado com sucesso")
-            except subprocess.CalledProcessError as e:
-                print(f"❌ Erro ao instalar {file_path.name}:")
-                print(e.stderr)
+        pip_options = []
+        if pip_supports_fast_deps():
+            # Baixa apenas os metadados das wheels durante a resolução
+            pip_options.append("--use-feature=fast-deps")
+        if force_reinstall:
+            pip_options.append("--force-reinstall")
+
+        # Evita a consulta de versão do pip ao PyPI a cada execução
+        env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+        pip_cmd = [sys.executable, "-m", "pip", "install", *pip_options]
+
+        file_names = ", ".join(file_path.name for file_path in files)
+        print(f"📦 Instalando {file_names}...")
+        if batch:
+            if not self._install_batch(pip_cmd, requirements, env):
+                print(f"❌ Erro ao instalar {file_names}")
                 return
+            print(f"✅ {file_names} instalado(s) com sucesso")
+        elif not self._install_per_module(pip_cmd, files, env):
+            return
 
         print("\n🎉 Instalação concluída!")
         print(f"Dependências instaladas: {total_deps}")
-        print(f"Economia vs. requirements.txt: {71 - total_deps} dependências")
+        print(f"Economia vs. requirements.txt: {BASELINE_DEPENDENCIES - total_deps} dependências")
 
-    def install_all(self, dry_run=False):
+    def install_all(self, dry_run=False, batch=True, force_reinstall=False):
         """Instala todas as dependências (equivale ao requirements.txt original)."""
         all_modules = list(self.modules.keys())
         print("🔥 Instalação COMPLETA - Todas as funcionalidades")
-        self.install_modules(all_modules, dry_run)
+        self.install_modules(all_modules, dry_run, batch, force_reinstall)
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def build_parser():
+    """
+    Constrói o parser da linha de comando (uma única vez por processo).
+
+    parse_args não altera o parser, então a instância em cache pode ser
+    reutilizada com diferentes sys.argv; quem a obtiver não deve adicionar
+    argumentos a ela.
+    """
     parser = argparse.ArgumentParser(
         description="OpenManus Modular Installation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -180,8 +406,21 @@ Exemplos:
     parser.add_argument("--all", action="store_true", help="Instalar tudo")
     parser.add_argument("--list", action="store_true", help="Listar módulos disponíveis")
     parser.add_argument("--dry-run", action="store_true", help="Mostrar o que seria instalado")
+    parser.add_argument(
+        "--per-module",
+        action="store_true",
+        help="Instalar cada módulo em um pip separado (em paralelo), isolando erros por módulo",
+    )
+    parser.add_argument(
+        "--force-reinstall",
+        action="store_true",
+        help="Reinstalar tudo, mesmo dependências já satisfeitas",
+    )
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    args = build_parser().parse_args()
 
     installer = ModularInstaller()
 
@@ -190,7 +429,7 @@ Exemplos:
         return
 
     if args.all:
-        installer.install_all(args.dry_run)
+        installer.install_all(args.dry_run, batch=not args.per_module, force_reinstall=args.force_reinstall)
         return
 
     # Determinar módulos a instalar
@@ -212,7 +451,12 @@ Exemplos:
         print("Use --list para ver módulos disponíveis")
         return
 
-    installer.install_modules(modules, args.dry_run)
+    installer.install_modules(
+        modules,
+        args.dry_run,
+        batch=not args.per_module,
+        force_reinstall=args.force_reinstall,
+    )
 
 
 if __name__ == "__main__":
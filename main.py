@@ -5,38 +5,55 @@ from app.flow.flow_factory import FlowFactory, FlowType
 from app.flow.multi_agent import ExecutionMode
 from app.logger import logger
 
+# Vocabulários de complexidade, construídos uma única vez no carregamento do módulo
+_KEYWORDS = (
+    "plan",
+    "multi",
+    "analyze",
+    "research",
+    "develop",
+    "create",
+    "implement",
+    "coordinate",
+    "collaborate",
+    "complex",
+)
+_DOMAINS = ("code", "research", "analysis", "web", "system")
+_TIME_WORDS = ("detailed", "comprehensive", "thorough", "complete")
+
+
+# Indicadores avaliados em ordem; os mais baratos e mais frequentes primeiro
+_COMPLEXITY_CHECKS = (
+    ("keywords", lambda _prompt, prompt_lower: any(keyword in prompt_lower for keyword in _KEYWORDS)),
+    ("length", lambda prompt, _prompt_lower: len(prompt.split()) > 20),
+    ("time_consuming", lambda _prompt, prompt_lower: any(word in prompt_lower for word in _TIME_WORDS)),
+    ("multiple_domains", lambda _prompt, prompt_lower: sum(domain in prompt_lower for domain in _DOMAINS) > 1),
+)
+_COMPLEX_THRESHOLD = 2
+
+
+def analyze_task_complexity(prompt: str, full_report: bool = False) -> dict:
+    """
+    Análise simples de complexidade da tarefa
+
+    A avaliação para assim que o limiar de complexidade é atingido; nesse caso
+    "indicators" contém apenas os indicadores avaliados. Use full_report=True
+    para avaliar todos.
+    """
+    prompt_lower = prompt.lower()
+    complexity_indicators = {}
+    complexity_score = 0
+    for name, check in _COMPLEXITY_CHECKS:
+        value = check(prompt, prompt_lower)
+        complexity_indicators[name] = value
+        complexity_score += value
+        if complexity_score >= _COMPLEX_THRESHOLD and not full_report:
+            break
 
-def analyze_task_complexity(prompt: str) -> dict:
-    """Análise simples de complexidade da tarefa"""
-    complexity_indicators = {
-        "length": len(prompt.split()) > 20,
-        "keywords": any(
-            keyword in prompt.lower()
-            for keyword in [
-                "plan",
-                "multi",
-                "analyze",
-                "research",
-                "develop",
-                "create",
-                "implement",
-                "coordinate",
-                "collaborate",
-                "complex",
-            ]
-        ),
-        "multiple_domains": len(
-            [domain for domain in ["code", "research", "analysis", "web", "system"] if domain in prompt.lower()]
-        )
-        > 1,
-        "time_consuming": any(word in prompt.lower() for word in ["detailed", "comprehensive", "thorough", "complete"]),
-    }
-
-    complexity_score = sum(complexity_indicators.values())
     return {
         "score": complexity_score,
         "indicators": complexity_indicators,
-        "is_complex": complexity_score >= 2,
+        "is_complex": complexity_score >= _COMPLEX_THRESHOLD,
     }
 
 
@@ -53,7 +70,8 @@ async def main():
 
         # Análise de complexidade
         task_analysis = analyze_task_complexity(prompt)
-        logger.info(f"Task complexity analysis: {task_analysis}")
+        # Score e indicadores são parciais (a análise para no limiar), só a decisão é registrada
+        logger.info(f"Task complexity analysis: is_complex={task_analysis['is_complex']}")
 
         # Criar agente principal
         manus_agent = await Manus.create()
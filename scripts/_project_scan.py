@@ -0,0 +1,78 @@
+"""
+Coleta de arquivos compartilhada pelos scripts de análise do projeto OpenManus
+
+Usado por analyze_migration.py e analyze_project_structure.py para que ambos
+percorram o diretório app/ com as mesmas regras.
+"""
+
+import os
+from pathlib import Path
+
+# Configure paths
+BASE_DIR = Path(__file__).resolve().parent.parent
+APP_DIR = BASE_DIR / "app"
+APP_DIR_STR = str(APP_DIR)
+
+# File types to analyze
+CODE_EXTENSIONS = frozenset({".py", ".json", ".yml", ".yaml"})
+IGNORE_PATTERNS = ["__pycache__", "*.pyc", "*.pyo", "*.pyd", "venv", ".env", ".git"]
+# Patterns are exact names or "*.ext" globs; split once so matching is two set lookups
+IGNORE_NAMES = frozenset(pattern for pattern in IGNORE_PATTERNS if not pattern.startswith("*."))
+IGNORE_EXTENSIONS = frozenset(pattern[1:] for pattern in IGNORE_PATTERNS if pattern.startswith("*."))
+
+
+def is_ignored(name: str) -> bool:
+    """Whether a file or directory name matches IGNORE_PATTERNS"""
+    if name in IGNORE_NAMES:
+        return True
+    dot = name.rfind(".")
+    return dot >= 0 and name[dot:] in IGNORE_EXTENSIONS
+
+
+def _scan_code_files(directory: str, files: list[str]) -> None:
+    """Append code files below directory to files, in the same top-down order as os.walk"""
+    subdirs = []
+    # DirEntry caches the type from the directory listing, no stat() per entry
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if is_ignored(entry.name):
+                    continue
+
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+
+                # Same rule as Path.suffix, without building a Path per file
+                dot = entry.name.rfind(".")
+                if dot > 0 and entry.name[dot:] in CODE_EXTENSIONS:
+                    files.append(entry.path)
+    except OSError:
+        return  # Unreadable directory, skipped like os.walk does
+
+    for subdir in subdirs:
+        _scan_code_files(subdir, files)
+
+
+def collect_code_files(directory: Path) -> list[str]:
+    """Collect code file paths from a directory recursively, ignoring specific patterns"""
+    files = []
+    if directory.exists():
+        _scan_code_files(str(directory), files)
+    return files
+
+
+def relative_to_app(path: str) -> str:
+    """Path relative to app/ for paths under APP_DIR (as collected), by slicing instead of os.path.relpath"""
+    return path[len(APP_DIR_STR) + 1 :]
+
+
+def module_name(file_path: str) -> str:
+    """Dotted module name of a file relative to app/"""
+    rel_path = relative_to_app(file_path)
+    # Drop the extension (a leading dot in the file name is not one, as with Path.suffix)
+    dot = rel_path.rfind(".")
+    if dot > rel_path.rfind(os.sep) + 1:
+        rel_path = rel_path[:dot]
+    return rel_path.replace(os.sep, ".")
@@ -5,11 +5,26 @@ Final Project Analysis Script - OpenManus
 Analyzes the complete project structure after backend directory cleanup and refactoring.
 """
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from heapq import nlargest
+from operator import itemgetter
 import os
 from pathlib import Path
+import re
 import subprocess
 
+# Faster JSON parsing when orjson is installed (optional)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Path segment marking bytecode cache directories (OS-native separator)
+_PYCACHE_SEGMENT = f"{os.sep}__pycache__{os.sep}"
+
 
 def run_command(cmd: str) -> tuple[str, int]:
     """Run shell command and return output and return code."""
@@ -22,20 +37,49 @@ def run_command(cmd: str) -> tuple[str, int]:
         return f"Error: {e}", 1
 
 
+def _scan(path):
+    """
+    Recursively yield os.DirEntry objects below path without following symlinked directories.
+
+    DirEntry caches the file type reported by the directory listing, so classifying
+    entries costs no extra stat() calls (unlike Path.rglob + is_file/is_dir).
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry.path)
+    except (PermissionError, FileNotFoundError):
+        return
+
+
+def _path_prefix(path) -> str:
+    """Return path with a trailing separator: the prefix of DirEntry.path for entries below it."""
+    prefix = os.fspath(path)
+    return prefix if prefix.endswith(os.sep) else prefix + os.sep
+
+
+def _extension(name: str) -> str:
+    """Return the lowercased suffix of a file name (same rules as Path.suffix)."""
+    i = name.rfind(".")
+    return name[i:].lower() if 0 < i < len(name) - 1 else "no_extension"
+
+
+def walk_project(base_path: Path) -> list[os.DirEntry]:
+    """Walk the project tree once so every analysis can share the same entries."""
+    return list(_scan(base_path))
+
+
 def count_files_by_extension(directory: Path) -> dict[str, int]:
     """Count files by extension in a directory."""
     if not directory.exists():
         return {}
 
-    counts = {}
-    for file_path in directory.rglob("*"):
-        if file_path.is_file():
-            ext = file_path.suffix.lower() or "no_extension"
-            counts[ext] = counts.get(ext, 0) + 1
-    return counts
+    return dict(Counter(_extension(entry.name) for entry in _scan(directory) if not entry.is_dir()))
 
 
-def analyze_directory_structure(base_path: Path) -> dict[str, any]:
+def analyze_directory_structure(base_path: Path, entries: list[os.DirEntry] | None = None) -> dict[str, any]:
     """Analyze the complete directory structure."""
     structure = {
         "total_directories": 0,
@@ -48,23 +92,28 @@ def analyze_directory_structure(base_path: Path) -> dict[str, any]:
     if not base_path.exists():
         return structure
 
-    # Count directories and files
-    for item in base_path.rglob("*"):
-        if item.is_dir():
+    if entries is None:
+        entries = walk_project(base_path)
+
+    # Single pass: totals, per top-level directory file counts and file types
+    prefix_len = len(_path_prefix(base_path))
+    top_level_files = Counter()
+    file_types = Counter()
+    for entry in entries:
+        top_level, nested, _ = entry.path[prefix_len:].partition(os.sep)
+        if entry.is_dir():
             structure["total_directories"] += 1
-            # Count files in each major directory
-            if item.parent == base_path:
-                file_count = sum(1 for f in item.rglob("*") if f.is_file())
-                if file_count > 10:  # Only large directories
-                    structure["large_directories"][item.name] = file_count
+            if not nested and not top_level.startswith("."):
+                structure["main_directories"].append(top_level)
         else:
             structure["total_files"] += 1
+            file_types[_extension(entry.name)] += 1
+            if nested:
+                top_level_files[top_level] += 1
 
-    # Get main directories
-    structure["main_directories"] = [d.name for d in base_path.iterdir() if d.is_dir() and not d.name.startswith(".")]
-
-    # Count file types
-    structure["file_types"] = count_files_by_extension(base_path)
+    # Only large directories
+    structure["large_directories"] = {name: count for name, count in top_level_files.items() if count > 10}
+    structure["file_types"] = dict(file_types)
 
     return structure
 
@@ -79,27 +128,66 @@ def check_git_status() -> dict[str, any]:
         "last_commit": "unknown",
     }
 
-    # Get current branch
-    branch_output, _ = run_command("git branch --show-current")
-    if branch_output:
-        git_info["branch"] = branch_output
+    # Branch, status and last commit from a single shell invocation
+    output, _ = run_command("git status --porcelain --branch && echo --- && git log -1 --format='%h - %s (%cr)'")
+    if not output:
+        return git_info
 
-    # Get status
-    status_output, _ = run_command("git status --porcelain")
-    if not status_output:
-        git_info["status"] = "clean"
-    else:
-        git_info["status"] = f"{len(status_output.splitlines())} modified files"
+    lines = output.splitlines()
+    separator = lines.index("---") if "---" in lines else len(lines)
+    status_lines, commit_lines = lines[:separator], lines[separator + 1 :]
 
-    # Get last commit
-    commit_output, _ = run_command("git log -1 --format='%h - %s (%cr)'")
-    if commit_output:
-        git_info["last_commit"] = commit_output
+    # Header: "## <branch>[...<upstream>] [ahead N, behind M]"
+    if status_lines and status_lines[0].startswith("## "):
+        header = status_lines.pop(0)[3:].removeprefix("No commits yet on ")
+        branch = header.split("...", 1)[0].split(" ", 1)[0]
+        if branch != "HEAD":  # Detached HEAD reports "HEAD (no branch)"
+            git_info["branch"] = branch
+        if ahead := re.search(r"ahead (\d+)", header):
+            git_info["commits_ahead"] = int(ahead.group(1))
+        if behind := re.search(r"behind (\d+)", header):
+            git_info["commits_behind"] = int(behind.group(1))
+
+    git_info["status"] = f"{len(status_lines)} modified files" if status_lines else "clean"
+
+    if commit_lines:
+        git_info["last_commit"] = commit_lines[0]
 
     return git_info
 
 
-def analyze_python_code() -> dict[str, any]:
+def _git_python_files(base_path: Path) -> list[str] | None:
+    """List tracked and unignored .py files from the git index, or None outside a git repository."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "*.py"],
+            cwd=base_path,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    prefix = _path_prefix(base_path)
+    return [prefix + path for path in os.fsdecode(result.stdout).split("\0") if path]
+
+
+def _count_lines(path: str) -> int:
+    """Count non-empty, non-comment lines in a Python file (0 if it can't be read)."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return 0  # Skip files that can't be read
+
+    # Bytes avoid decoding the file and building a str per line
+    code_lines = 0
+    for line in data.splitlines():
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith(b"#"):
+            code_lines += 1
+    return code_lines
+
+
+def analyze_python_code(entries: list[os.DirEntry] | None = None) -> dict[str, any]:
     """Analyze Python code structure."""
     python_info = {
         "total_py_files": 0,
@@ -110,24 +198,24 @@ def analyze_python_code() -> dict[str, any]:
 
     base_path = Path()
 
-    # Count Python files and lines
-    for py_file in base_path.rglob("*.py"):
-        if "/__pycache__/" in str(py_file):
-            continue
-
-        python_info["total_py_files"] += 1
+    # Without a shared walk, the git index lists the files without traversing the tree
+    py_files = _git_python_files(base_path) if entries is None else None
+    if py_files is None:
+        if entries is None:
+            entries = walk_project(base_path)
+        py_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".py") and not entry.is_dir() and _PYCACHE_SEGMENT not in entry.path
+        ]
 
-        if "test" in py_file.name.lower():
-            python_info["test_files"] += 1
+    # Count Python files and lines
+    python_info["total_py_files"] = len(py_files)
+    python_info["test_files"] = sum(1 for path in py_files if "test" in Path(path).name.lower())
 
-        try:
-            with py_file.open("r", encoding="utf-8") as f:
-                lines = f.readlines()
-                # Count non-empty, non-comment lines
-                code_lines = [line for line in lines if line.strip() and not line.strip().startswith("#")]
-                python_info["lines_of_code"] += len(code_lines)
-        except Exception:  # noqa: S112
-            continue  # Skip files that can't be read or parsed
+    # Line counting is CPU bound, spread it over all cores
+    with ProcessPoolExecutor() as executor:
+        python_info["lines_of_code"] = sum(executor.map(_count_lines, py_files, chunksize=64))
 
     # Get main modules in app/
     app_path = base_path / "app"
@@ -137,7 +225,7 @@ def analyze_python_code() -> dict[str, any]:
     return python_info
 
 
-def analyze_frontend() -> dict[str, any]:
+def analyze_frontend(entries: list[os.DirEntry] | None = None) -> dict[str, any]:
     """Analyze frontend structure."""
     frontend_info = {
         "exists": False,
@@ -158,29 +246,32 @@ def analyze_frontend() -> dict[str, any]:
     if package_json.exists():
         frontend_info["package_json_exists"] = True
         try:
-            import json
-
-            with package_json.open("r") as f:
-                package_data = json.load(f)
-                deps = package_data.get("dependencies", {})
-                if "react" in deps:
-                    frontend_info["framework"] = f"React {deps.get('react', 'unknown')}"
-                elif "vue" in deps:
-                    frontend_info["framework"] = f"Vue {deps.get('vue', 'unknown')}"
-                elif "angular" in deps:
-                    frontend_info["framework"] = f"Angular {deps.get('@angular/core', 'unknown')}"
+            package_data = json_loads(package_json.read_bytes())
+            deps = package_data.get("dependencies", {})
+            if "react" in deps:
+                frontend_info["framework"] = f"React {deps.get('react', 'unknown')}"
+            elif "vue" in deps:
+                frontend_info["framework"] = f"Vue {deps.get('vue', 'unknown')}"
+            elif "angular" in deps:
+                frontend_info["framework"] = f"Angular {deps.get('@angular/core', 'unknown')}"
         except Exception:  # noqa: S110
             pass  # JSON parsing failed, skip package analysis
 
-    # Count TypeScript/JavaScript files
-    for ext in ["*.ts", "*.tsx", "*.js", "*.jsx"]:
-        files = list(frontend_path.rglob(ext))
-        if ext in ["*.ts", "*.tsx"]:
-            frontend_info["total_ts_files"] += len(files)
+    if entries is None:
+        entries = walk_project(frontend_path)
+
+    # Count TypeScript/JavaScript files in a single pass
+    for entry in entries:
+        ext = _extension(entry.name)
+        if ext not in (".ts", ".tsx", ".js", ".jsx") or entry.is_dir():
+            continue
+
+        if ext in (".ts", ".tsx"):
+            frontend_info["total_ts_files"] += 1
 
         # Count components (files in components directories)
-        component_files = [f for f in files if "component" in str(f).lower() or "/components/" in str(f)]
-        frontend_info["total_components"] += len(component_files)
+        if "component" in entry.path.lower():
+            frontend_info["total_components"] += 1
 
     return frontend_info
 
@@ -190,25 +281,29 @@ def generate_final_report() -> str:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     base_path = Path()
 
-    # Collect all analysis data
-    directory_analysis = analyze_directory_structure(base_path)
+    # Collect all analysis data from a single walk of the project tree
+    entries = walk_project(base_path)
+    base_prefix = _path_prefix(base_path)
+    frontend_prefix = f"{base_prefix}frontend{os.sep}"
+    directory_analysis = analyze_directory_structure(base_path, entries)
     git_analysis = check_git_status()
-    python_analysis = analyze_python_code()
-    frontend_analysis = analyze_frontend()
+    python_analysis = analyze_python_code(entries)
+    frontend_analysis = analyze_frontend([entry for entry in entries if entry.path.startswith(frontend_prefix)])
 
-    # Check for specific directories
+    # Check for specific directories (answered from the walk, no extra stat calls)
+    directories = {entry.path for entry in entries if entry.is_dir()}
     key_directories = {
-        "app": (base_path / "app").exists(),
-        "frontend": (base_path / "frontend").exists(),
-        "config": (base_path / "config").exists(),
-        "docs": (base_path / "docs").exists(),
-        "tests": (base_path / "tests").exists(),
-        "scripts": (base_path / "scripts").exists(),
-        "backend": (base_path / "backend").exists(),  # Should be False after cleanup
+        name: base_prefix + name in directories
+        for name in ("app", "frontend", "config", "docs", "tests", "scripts", "backend")  # backend: False after cleanup
     }
+    config_examples_exists = f"{base_prefix}config{os.sep}examples" in directories
 
-    # Generate report
-    return f"""
+    # Only the ten most common file types are reported
+    top_file_types = nlargest(10, directory_analysis["file_types"].items(), key=itemgetter(1))
+
+    # Generate report section by section; listings are appended line by line
+    parts = [
+        f"""
 # 📊 OpenManus - Final Project Analysis Report
 
 **Generated**: {timestamp}
@@ -241,9 +336,11 @@ def generate_final_report() -> str:
 - **Total Files**: {directory_analysis["total_files"]:,}
 - **Main Directories**: {len(directory_analysis["main_directories"])}
 
-### **Large Directories** (>10 files):
-{chr(10).join([f"- **{name}**: {count:,} files" for name, count in directory_analysis["large_directories"].items()])}
-
+### **Large Directories** (>10 files):"""
+    ]
+    parts.extend(f"- **{name}**: {count:,} files" for name, count in directory_analysis["large_directories"].items())
+    parts.append(
+        f"""
 ## 🐍 Python Backend Analysis
 
 ### **Code Statistics:**
@@ -251,21 +348,13 @@ def generate_final_report() -> str:
 - **Lines of Code**: {python_analysis["lines_of_code"]:,}
 - **Test Files**: {python_analysis["test_files"]:,}
 
-### **Main Modules** (in app/):
-{chr(10).join([f"- {module}" for module in python_analysis["main_modules"]])}
-
-### **File Type Distribution:**
-{
-        chr(10).join(
-            [
-                f"- **{ext}**: {count:,} files"
-                for ext, count in sorted(directory_analysis["file_types"].items(), key=lambda x: x[1], reverse=True)[
-                    :10
-                ]
-            ]
-        )
-    }
-
+### **Main Modules** (in app/):"""
+    )
+    parts.extend(f"- {module}" for module in python_analysis["main_modules"])
+    parts.append("\n### **File Type Distribution:**")
+    parts.extend(f"- **{ext}**: {count:,} files" for ext, count in top_file_types)
+    parts.append(
+        f"""
 ## ⚛️ Frontend Analysis
 
 ### **Framework Information:**
@@ -287,7 +376,7 @@ def generate_final_report() -> str:
 ## 🔧 Configuration Analysis
 
 ### **Config Examples** (maintained):
-- **config/examples/**: {"✅ EXISTS" if (base_path / "config" / "examples").exists() else "❌ MISSING"}
+- **config/examples/**: {"✅ EXISTS" if config_examples_exists else "❌ MISSING"}
   - Configuration templates for all LLM providers
   - MCP (Model Context Protocol) examples
   - Referenced in README.md documentation
@@ -341,7 +430,10 @@ All refactoring objectives have been successfully achieved.
 ---
 
 *Report generated by analyze_final_project.py - OpenManus Analysis Tool*
-    """.strip()
+    """
+    )
+
+    return "\n".join(parts).strip()
 
 
 def main():
@@ -6,59 +6,39 @@ Parte da refatoração do projeto OpenManus
 """
 
 from collections import defaultdict
-import fnmatch
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 import sys
 
-# Configure paths
-BASE_DIR = Path(__file__).resolve().parent.parent
-APP_DIR = BASE_DIR / "app"
+try:
+    from ._project_scan import APP_DIR, collect_code_files, module_name, relative_to_app
+except ImportError:  # Run as a script (python scripts/analyze_migration.py)
+    from _project_scan import APP_DIR, collect_code_files, module_name, relative_to_app
 
-# File types to analyze
-CODE_EXTENSIONS = [".py", ".json", ".yml", ".yaml"]
-IGNORE_PATTERNS = ["__pycache__", "*.pyc", "*.pyo", "*.pyd", "venv", ".env", ".git"]
+# Import statements at the start of a line ("from x import" / "import x")
+IMPORT_PATTERN = re.compile(r"^(?:from|import)\s+([.\w]+)(?:\s+import)?", re.MULTILINE)
 
 
 class ProjectAnalyzer:
-    def __init__(self):
-        self.app_files = {}
+    def __init__(self, app_files=None):
+        # app_files may be injected to reuse a scan already done by another analyzer
+        self.app_files = app_files
         self.app_modules = set()
         self.issues = []
 
     def collect_files(self):
         """Collect all relevant files from app directory"""
         print("🔍 Analisando estrutura do projeto...")
-        self.app_files = self._collect_dir_files(APP_DIR)
+        if self.app_files is None:
+            self.app_files = self._collect_dir_files(APP_DIR)
 
         # Extract module names from file paths
-        for file_path in self.app_files:
-            rel_path = os.path.relpath(file_path, APP_DIR)
-            module_path = Path(rel_path).with_suffix("").as_posix().replace("/", ".")
-            self.app_modules.add(module_path)
+        self.app_modules.update(module_name(file_path) for file_path in self.app_files)
 
     def _collect_dir_files(self, directory):
-        """Collect files from a directory recursively"""
-        files = {}
-        if not directory.exists():
-            return files
-
-        for root, dirs, filenames in os.walk(directory):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if not any(fnmatch.fnmatch(d, pattern) for pattern in IGNORE_PATTERNS)]
-
-            for filename in filenames:
-                if any(filename.endswith(ext) for ext in CODE_EXTENSIONS):
-                    file_path = Path(root) / filename
-                    try:
-                        with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-                            content = f.read()
-                        files[str(file_path)] = content
-                    except (UnicodeDecodeError, PermissionError) as e:
-                        print(f"⚠️  Erro ao ler {file_path}: {e}")
-
-        return files
+        """Collect file paths from a directory recursively (contents are read on demand)"""
+        return collect_code_files(directory)
 
     def check_project_health(self):
         """Check for common issues in the project structure"""
@@ -76,34 +56,48 @@ class ProjectAnalyzer:
     def _check_missing_init_files(self):
         """Check for directories that should have __init__.py"""
         python_dirs = set()
+        package_dirs = set()
 
         for file_path in self.app_files:
             if file_path.endswith(".py"):
-                dir_path = Path(file_path).parent
-                while str(dir_path) != str(APP_DIR):
-                    python_dirs.add(str(dir_path))
-                    dir_path = dir_path.parent
-
-        for dir_path in python_dirs:
-            init_file = Path(dir_path) / "__init__.py"
-            if not init_file.exists():
-                rel_path = os.path.relpath(dir_path, APP_DIR)
-                self.issues.append(f"Faltando __init__.py em: {rel_path}")
+                rel_file = Path(relative_to_app(file_path))
+                # Every ancestor below app/ (parents[-1] is app/ itself)
+                python_dirs.update(rel_file.parents[:-1])
+                # The walk already listed every __init__.py, no need to stat them again
+                if rel_file.name == "__init__.py":
+                    package_dirs.add(rel_file.parent)
+
+        for rel_path in python_dirs - package_dirs:
+            self.issues.append(f"Faltando __init__.py em: {rel_path}")
+
+    @staticmethod
+    def _read_file(file_path):
+        """Read a file, returning (content, error) so it can run in a thread pool"""
+        try:
+            return Path(file_path).read_text(encoding="utf-8", errors="ignore"), None
+        except OSError as e:
+            return None, e
 
     def _check_imports(self):
         """Check for potentially broken imports"""
-        import_pattern = re.compile(r"^(?:from|import)\s+([.\w]+)(?:\s+import)?", re.MULTILINE)
+        py_files = [file_path for file_path in self.app_files if file_path.endswith(".py")]
+
+        # File reads release the GIL, so overlap them instead of waiting on each in turn
+        with ThreadPoolExecutor() as executor:
+            for file_path, (content, error) in zip(py_files, executor.map(self._read_file, py_files), strict=True):
+                if error is not None:
+                    print(f"⚠️  Erro ao ler {file_path}: {error}")
+                    continue
 
-        for file_path, content in self.app_files.items():
-            if not file_path.endswith(".py"):
-                continue
+                if "backend" not in content.lower():
+                    continue
 
-            imports = import_pattern.findall(content)
-            for imp in imports:
-                # Check for old backend imports
-                if "backend" in imp.lower():
-                    rel_path = os.path.relpath(file_path, APP_DIR)
-                    self.issues.append(f"Possível import obsoleto em {rel_path}: {imp}")
+                for match in IMPORT_PATTERN.finditer(content):
+                    imp = match.group(1)
+                    # Check for old backend imports
+                    if "backend" in imp.lower():
+                        rel_path = relative_to_app(file_path)
+                        self.issues.append(f"Possível import obsoleto em {rel_path}: {imp}")
 
     def _check_duplicates(self):
         """Check for potential duplicate functionality"""
@@ -113,7 +107,7 @@ class ProjectAnalyzer:
         for file_path in self.app_files:
             if file_path.endswith(".py"):
                 file_name = Path(file_path).stem
-                rel_path = os.path.relpath(file_path, APP_DIR)
+                rel_path = relative_to_app(file_path)
                 file_names[file_name].append(rel_path)
 
         for name, paths in file_names.items():
@@ -122,32 +116,33 @@ class ProjectAnalyzer:
 
     def generate_report(self):
         """Generate a comprehensive analysis report"""
-        print("\n" + "=" * 80)
-        print("📊 RELATÓRIO DE ANÁLISE DO PROJETO OPENMANUS")
-        print("=" * 80)
-
-        print("\n📁 Estrutura do Projeto:")
-        print("   • Diretório principal: app/")
-        print(f"   • Arquivos Python analisados: {len([f for f in self.app_files if f.endswith('.py')])}")
-        print(f"   • Módulos identificados: {len(self.app_modules)}")
-
-        print("\n🎯 Status da Migração:")
-        print("   ✅ Diretório backend/ removido com sucesso")
-        print("   ✅ Estrutura consolidada em app/")
+        # Collect the report and write it to stdout once
+        lines = [
+            "\n" + "=" * 80,
+            "📊 RELATÓRIO DE ANÁLISE DO PROJETO OPENMANUS",
+            "=" * 80,
+            "\n📁 Estrutura do Projeto:",
+            "   • Diretório principal: app/",
+            f"   • Arquivos Python analisados: {len([f for f in self.app_files if f.endswith('.py')])}",
+            f"   • Módulos identificados: {len(self.app_modules)}",
+            "\n🎯 Status da Migração:",
+            "   ✅ Diretório backend/ removido com sucesso",
+            "   ✅ Estrutura consolidada em app/",
+        ]
 
         if self.issues:
-            print(f"\n⚠️  Problemas Identificados ({len(self.issues)}):")
-            for i, issue in enumerate(self.issues, 1):
-                print(f"   {i}. {issue}")
+            lines.append(f"\n⚠️  Problemas Identificados ({len(self.issues)}):")
+            lines.extend(f"   {i}. {issue}" for i, issue in enumerate(self.issues, 1))
         else:
-            print("\n✅ Nenhum problema identificado!")
+            lines.append("\n✅ Nenhum problema identificado!")
 
-        print("\n📋 Módulos Principais:")
+        lines.append("\n📋 Módulos Principais:")
         main_modules = [m for m in sorted(self.app_modules) if "." not in m and m != "__init__"]
-        for module in main_modules[:10]:  # Show first 10
-            print(f"   • {module}")
+        lines.extend(f"   • {module}" for module in main_modules[:10])  # Show first 10
         if len(main_modules) > 10:
-            print(f"   ... e mais {len(main_modules) - 10} módulos")
+            lines.append(f"   ... e mais {len(main_modules) - 10} módulos")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def run_analysis(self):
         """Run the complete analysis"""
@@ -10,147 +10,260 @@ Data da atualização: 3 de junho de 2025
 Razão: Remoção do diretório backend/ obsoleto durante refatoração
 """
 
-from collections import defaultdict
-import fnmatch
+import ast
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import json
 import os
 from pathlib import Path
-
-# Configure paths
-BASE_DIR = Path(__file__).resolve().parent.parent
-APP_DIR = BASE_DIR / "app"
-
-# File types to analyze
-CODE_EXTENSIONS = [".py", ".json", ".yml", ".yaml"]
-IGNORE_PATTERNS = ["__pycache__", "*.pyc", "*.pyo", "*.pyd", "venv", ".env", ".git"]
+import re
+import sys
+
+try:
+    from ._project_scan import APP_DIR, APP_DIR_STR, collect_code_files, module_name, relative_to_app
+except ImportError:  # Run as a script (python scripts/analyze_project_structure.py)
+    from _project_scan import APP_DIR, APP_DIR_STR, collect_code_files, module_name, relative_to_app
+
+# Imports extracted per file, reused across runs while (mtime, size) are unchanged.
+# Kept under __pycache__ so it is already ignored by git.
+IMPORT_CACHE_FILE = Path(__file__).resolve().parent / "__pycache__" / "analyze_imports_cache.json"
+# Bump whenever _extract_imports changes what it reports, to discard stale entries
+IMPORT_CACHE_VERSION = 3
+
+
+def _load_import_cache():
+    """Load the import cache: {path: [mtime_ns, size, external, internal]}"""
+    try:
+        cache = json.loads(IMPORT_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("version") == IMPORT_CACHE_VERSION else {}
+
+
+def _save_import_cache(files):
+    """Persist the import cache, ignoring write failures (the cache is only an optimization)"""
+    with contextlib.suppress(OSError):
+        IMPORT_CACHE_FILE.parent.mkdir(exist_ok=True)
+        IMPORT_CACHE_FILE.write_text(json.dumps({"version": IMPORT_CACHE_VERSION, "files": files}), encoding="utf-8")
+
+
+def _file_stamp(file_path):
+    """[mtime_ns, size] of a file, None if it can't be stat'ed"""
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _module_level_imports(body):
+    """Yield module-level import nodes, including those guarded by top-level try/if blocks"""
+    for node in body:
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            yield node
+        elif isinstance(node, ast.If):
+            # e.g. "if TYPE_CHECKING:" or platform-specific imports
+            yield from _module_level_imports(node.body)
+            yield from _module_level_imports(node.orelse)
+        elif isinstance(node, ast.Try | ast.TryStar):
+            # e.g. optional dependencies: "try: import x / except ImportError: ..."
+            yield from _module_level_imports(node.body)
+            for handler in node.handlers:
+                yield from _module_level_imports(handler.body)
+            yield from _module_level_imports(node.orelse)
+            yield from _module_level_imports(node.finalbody)
+
+
+# Import lines for files ast can't parse (e.g. newer syntax than the running interpreter):
+# "from <dots><module> import" or "import <names>", at any indentation
+_IMPORT_LINE_PATTERN = re.compile(
+    r"^[ \t]*(?:from[ \t]+(\.*)([\w.]*)[ \t]+import\b|import[ \t]+([\w.]+(?:[ \t]*,[ \t]*[\w.]+)*))", re.MULTILINE
+)
+
+
+def _scan_import_lines(source):
+    """Yield (level, top-level module) for import lines found textually, without parsing"""
+    for dots, from_module, import_names in _IMPORT_LINE_PATTERN.findall(source):
+        if import_names:
+            for name in import_names.split(","):
+                yield 0, name.strip().split(".", 1)[0]
+        else:
+            yield len(dots), from_module.split(".", 1)[0]
+
+
+def _parsed_imports(tree):
+    """Yield (level, top-level module) for the module-level import statements of a parsed file"""
+    for node in _module_level_imports(tree.body):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield 0, alias.name.split(".", 1)[0]
+        else:
+            yield node.level, (node.module or "").split(".", 1)[0]
+
+
+def _extract_imports(file_path):
+    """
+    Return (external, internal, error) top-level modules imported by a Python file
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    external_imports = set()
+    internal_imports = set()
+
+    try:
+        raw = Path(file_path).read_bytes()
+        # Cheap pre-filter: no "import" bytes means no import statements ("from x import y" included)
+        if b"import" not in raw:
+            return external_imports, internal_imports, None
+        source = raw.decode("utf-8", errors="replace")
+    except Exception as e:
+        return external_imports, internal_imports, str(e)
+
+    try:
+        # Module-level import statements only; function and class bodies are never visited
+        imports = _parsed_imports(ast.parse(source, filename=file_path))
+    except (SyntaxError, ValueError):
+        # Unparseable here (e.g. Python 3.12 f-strings on an older interpreter): scan the lines
+        # instead of dropping the file, including imports nested in functions
+        imports = _scan_import_lines(source)
+
+    for level, module in imports:
+        if level:  # Relative import, recorded as "." / ".."
+            internal_imports.add("." * level)
+        elif module.startswith("app"):
+            internal_imports.add(module)
+        else:
+            external_imports.add(module)
+
+    return external_imports, internal_imports, None
 
 
 class ProjectAnalyzer:
     """Analisa a estrutura atual do projeto após refatoração"""
 
-    def __init__(self):
-        self.app_files = {}
+    # No per-instance __dict__; Python files are kept as their own list alongside app_files
+    __slots__ = ("app_files", "app_modules", "py_files", "directories")
+
+    def __init__(self, app_files=None):
+        # app_files may be injected to reuse a scan already done by another analyzer
+        self.app_files = app_files
         self.app_modules = set()
+        self.py_files = []
+        self.directories = Counter()
 
-    def collect_files(self):
+    def collect_files(self, out=None):
         """Collect all relevant files from app directory"""
-        print("📁 Coletando arquivos do diretório app/...")
-        self.app_files = self._collect_dir_files(APP_DIR)
+        print("📁 Coletando arquivos do diretório app/...", file=out)
+        if self.app_files is None:
+            self.app_files = self._collect_dir_files(APP_DIR, out)
 
-        # Extract module names from file paths
+        # Derive what the analyses need in a single pass over the files
         for file_path in self.app_files:
-            rel_path = os.path.relpath(file_path, APP_DIR)
-            module_path = Path(rel_path).with_suffix("").as_posix().replace("/", ".")
-            self.app_modules.add(module_path)
-
-    def _collect_dir_files(self, directory):
-        """Collect files from a directory, ignoring specific patterns"""
-        files = []
-        if not directory.exists():
-            print(f"⚠️  Diretório não encontrado: {directory}")
-            return files
+            self.app_modules.add(module_name(file_path))
 
-        for root, dirs, filenames in os.walk(directory):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if not any(fnmatch.fnmatch(d, pattern) for pattern in IGNORE_PATTERNS)]
+            # Collected paths always contain os.sep; slicing avoids os.path.dirname per file
+            dir_path = file_path[: file_path.rfind(os.sep)]
+            if dir_path != APP_DIR_STR:
+                self.directories[relative_to_app(dir_path)] += 1
 
-            for filename in filenames:
-                if any(fnmatch.fnmatch(filename, pattern) for pattern in IGNORE_PATTERNS):
-                    continue
+            if file_path.endswith(".py"):
+                self.py_files.append(file_path)
 
-                file_path = Path(root) / filename
-                ext = Path(filename).suffix
-                if ext in CODE_EXTENSIONS:
-                    files.append(str(file_path))
-        return files
+    def _collect_dir_files(self, directory, out=None):
+        """Collect files from a directory, ignoring specific patterns"""
+        if not directory.exists():
+            print(f"⚠️  Diretório não encontrado: {directory}", file=out)
+        return collect_code_files(directory)
 
-    def analyze_structure(self):
+    def analyze_structure(self, out=None):
         """Analyze current project structure"""
-        print("\n📊 Análise da Estrutura do Projeto")
-        print("=" * 50)
+        print("\n📊 Análise da Estrutura do Projeto", file=out)
+        print("=" * 50, file=out)
 
-        # Analyze directories
-        directories = defaultdict(int)
-        for file_path in self.app_files:
-            rel_path = os.path.relpath(file_path, APP_DIR)
-            dir_name = Path(rel_path).parent
-            if str(dir_name) != ".":
-                directories[str(dir_name)] += 1
+        # Analyze directories (counted while collecting files)
+        directories = self.directories
 
-        print(f"\n📂 Diretórios encontrados em app/ ({len(directories)} diretórios):")
+        print(f"\n📂 Diretórios encontrados em app/ ({len(directories)} diretórios):", file=out)
         for dir_name, file_count in sorted(directories.items()):
-            print(f"  • {dir_name}: {file_count} arquivo(s)")
+            print(f"  • {dir_name}: {file_count} arquivo(s)", file=out)
 
-        print(f"\n📄 Total de arquivos Python: {len([f for f in self.app_files if f.endswith('.py')])}")
-        print(f"📄 Total de arquivos de configuração: {len([f for f in self.app_files if not f.endswith('.py')])}")
+        # py_files was filled while collecting, everything else is configuration
+        py_count = len(self.py_files)
+        print(f"\n📄 Total de arquivos Python: {py_count}", file=out)
+        print(f"📄 Total de arquivos de configuração: {len(self.app_files) - py_count}", file=out)
 
-    def analyze_imports(self):
+    def analyze_imports(self, out=None):
         """Analyze imports in project files"""
-        print("\n📦 Análise de Imports")
-        print("=" * 30)
+        print("\n📦 Análise de Imports", file=out)
+        print("=" * 30, file=out)
 
         external_imports = set()
         internal_imports = set()
 
-        for file_path in self.app_files:
-            if not file_path.endswith(".py"):
-                continue
-
-            try:
-                with Path(file_path).open(encoding="utf-8") as f:
-                    content = f.read()
-
-                # Find import statements
-                import_lines = []
-                for line in content.split("\n"):
-                    line = line.strip()
-                    if line.startswith("import ") or line.startswith("from "):
-                        import_lines.append(line)
-
-                for import_line in import_lines:
-                    # Extract module name
-                    if import_line.startswith("from "):
-                        module = import_line.split()[1].split(".")[0]
-                    else:  # starts with 'import '
-                        module = import_line.split()[1].split(".")[0]
-
-                    if module.startswith("app") or module == "." or module.startswith(".."):
-                        internal_imports.add(module)
-                    else:
-                        external_imports.add(module)
-
-            except Exception as e:
-                print(f"⚠️  Erro ao ler {file_path}: {e}")
-
-        print(f"\n🔗 Imports externos únicos: {len(external_imports)}")
+        cache = _load_import_cache()
+        updated_cache = {}
+        to_parse = []
+
+        # Reuse imports of files unchanged since the last run
+        for file_path in self.py_files:
+            stamp = _file_stamp(file_path)
+            cached = cache.get(file_path)
+            if stamp is not None and cached is not None and cached[:2] == stamp:
+                external_imports.update(cached[2])
+                internal_imports.update(cached[3])
+                updated_cache[file_path] = cached
+            else:
+                to_parse.append((file_path, stamp))
+
+        # Reading and parsing is independent per file, spread it over all cores
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_extract_imports, [file_path for file_path, _ in to_parse], chunksize=32)
+            for (file_path, stamp), (external, internal, error) in zip(to_parse, results, strict=True):
+                if error is not None:
+                    print(f"⚠️  Erro ao ler {file_path}: {error}", file=out)
+                elif stamp is not None:
+                    updated_cache[file_path] = [*stamp, sorted(external), sorted(internal)]
+                external_imports |= external
+                internal_imports |= internal
+
+        _save_import_cache(updated_cache)
+
+        print(f"\n🔗 Imports externos únicos: {len(external_imports)}", file=out)
         if external_imports:
             sorted_external = sorted(external_imports)[:10]  # Show first 10
             for imp in sorted_external:
-                print(f"  • {imp}")
+                print(f"  • {imp}", file=out)
             if len(external_imports) > 10:
-                print(f"  ... e mais {len(external_imports) - 10}")
+                print(f"  ... e mais {len(external_imports) - 10}", file=out)
 
-        print(f"\n🏠 Imports internos únicos: {len(internal_imports)}")
+        print(f"\n🏠 Imports internos únicos: {len(internal_imports)}", file=out)
         for imp in sorted(internal_imports):
-            print(f"  • {imp}")
+            print(f"  • {imp}", file=out)
 
     def generate_report(self):
         """Generate comprehensive project analysis report"""
-        print("\n" + "=" * 60)
-        print("🎯 RELATÓRIO DE ANÁLISE DO PROJETO OPENMANUS")
-        print("=" * 60)
-        print("📅 Data: 3 de junho de 2025")
-        print("🔧 Status: Projeto refatorado (diretório backend/ removido)")
-        print(f"📁 Diretório analisado: {APP_DIR}")
-
-        self.collect_files()
-        self.analyze_structure()
-        self.analyze_imports()
-
-        print("\n✅ CONCLUSÕES:")
-        print("  • Estrutura do projeto limpa e organizada")
-        print("  • Diretório backend/ obsoleto removido com sucesso")
-        print("  • Arquitetura consolidada no diretório app/")
-        print("  • Projeto pronto para desenvolvimento contínuo")
+        # Buffer the whole report and write it to stdout once
+        out = io.StringIO()
+        print("\n" + "=" * 60, file=out)
+        print("🎯 RELATÓRIO DE ANÁLISE DO PROJETO OPENMANUS", file=out)
+        print("=" * 60, file=out)
+        print("📅 Data: 3 de junho de 2025", file=out)
+        print("🔧 Status: Projeto refatorado (diretório backend/ removido)", file=out)
+        print(f"📁 Diretório analisado: {APP_DIR}", file=out)
+
+        self.collect_files(out)
+        self.analyze_structure(out)
+        self.analyze_imports(out)
+
+        print("\n✅ CONCLUSÕES:", file=out)
+        print("  • Estrutura do projeto limpa e organizada", file=out)
+        print("  • Diretório backend/ obsoleto removido com sucesso", file=out)
+        print("  • Arquitetura consolidada no diretório app/", file=out)
+        print("  • Projeto pronto para desenvolvimento contínuo", file=out)
+
+        sys.stdout.write(out.getvalue())
 
 
 def main():
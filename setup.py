@@ -15,7 +15,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/mannaandpoem/OpenManus",
     packages=find_packages(),
-    install_requires=[
+    install_requires=(
         "pydantic~=2.10.4",
         "openai>=1.58.1,<1.85.0",
         "tenacity~=9.0.0",
@@ -41,7 +41,7 @@ setup(
         "docling-core~=2.31.2",
         "docling-ibm-models~=3.4.3",
         "docling-parse~=4.0.1",
-    ],
+    ),
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.12",
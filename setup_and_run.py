@@ -6,26 +6,70 @@ Script único que verifica todos os requisitos do ambiente,
 configura automaticamente se necessário e inicializa o sistema.
 
 Uso:
-    python setup_and_run.py [--backend-only] [--skip-tests] [--force-reinstall]
+    python setup_and_run.py [--backend-only [--embed]] [--skip-tests] [--force-reinstall]
 
 Opções:
     --backend-only      Executa apenas o backend (sem frontend)
+    --embed             Com --backend-only, o backend substitui o processo deste script
     --skip-tests        Pula os testes de verificação
     --force-reinstall   Força reinstalação das dependências
     --help              Mostra esta mensagem
 """
 
+# Módulos usados só em alguns caminhos (venv, json, signal, socket, platform, concurrent.futures)
+# são importados nos métodos que os usam, para que --help e execuções curtas não paguem por eles
 import argparse
-import json
+import contextlib
+from dataclasses import dataclass
+import hashlib
 import os
 from pathlib import Path
-import platform
 import shutil
-import signal
 import subprocess
 import sys
+import threading
 import time
-import venv
+
+# Mínimo para a definição deste script (dataclass(slots=True), anotações "X | None"). Verificado já no
+# carregamento: em versões anteriores o erro aconteceria antes de check_system_requirements rodar.
+REQUIRED_PYTHON_VERSION = (3, 10)
+if sys.version_info < REQUIRED_PYTHON_VERSION:
+    sys.exit(f"❌ Python {'.'.join(map(str, REQUIRED_PYTHON_VERSION))}+ necessário. Encontrado: {sys.version}")
+
+# Trecho executado por módulo no subprocesso de verificação de imports
+IMPORT_PROBE_TEMPLATE = """
+try:
+    import {module}
+    print("OK:{module}")
+except Exception as e:
+    print("FAIL:{module}:" + " ".join(str(e).split()))
+"""
+
+# Pacotes cujo módulo importável tem outro nome (os demais: nome do pacote com "-" trocado por "_")
+PACKAGE_IMPORT_NAMES = {"pillow": "PIL"}
+
+# Cache local do OpenManus (resultados de verificações do sistema)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "openmanus"
+PROBE_CACHE_FILE = CACHE_DIR / "probes.json"
+# Cache de wheels do pip, persistente entre execuções e reinstalações do venv
+PIP_CACHE_DIR = CACHE_DIR / "pip"
+
+# Validade das verificações em cache, em segundos
+TOOL_PROBE_TTL = 24 * 60 * 60  # Versão das ferramentas (também invalidada quando o executável muda)
+NETWORK_PROBE_TTL = 5 * 60
+DOCKER_DAEMON_PROBE_TTL = 5 * 60
+
+# Gerenciador de pacotes do frontend escolhido pelo lockfile presente (npm sem lockfile ou ferramenta)
+FRONTEND_LOCKFILES = (
+    ("pnpm-lock.yaml", "pnpm"),
+    ("bun.lock", "bun"),
+    ("bun.lockb", "bun"),
+    ("package-lock.json", "npm"),
+)
+
+# Linhas do uvicorn que indicam que o backend está aceitando conexões
+BACKEND_READY_MARKERS = (b"Application startup complete", b"Uvicorn running on")
+BACKEND_READY_TIMEOUT = 30  # segundos
 
 
 # Cores para output
@@ -40,34 +84,130 @@ class Colors:
     NC = "\033[0m"  # No Color
 
 
+# Sem códigos ANSI fora de um terminal (ex.: logs de CI) ou com NO_COLOR definido (https://no-color.org)
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    for _color in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _color, "")
+
+# Prefixos e sufixo pré-montados: cada mensagem é uma única escrita em stdout
+_STEP_PREFIX = f"{Colors.BLUE}\n🔧 "
+_SUCCESS_PREFIX = f"{Colors.GREEN}✅ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠️  "
+_ERROR_PREFIX = f"{Colors.RED}❌ "
+_INFO_PREFIX = f"{Colors.CYAN}ⓘ  "
+_SUFFIX = f"{Colors.NC}\n"
+
+
 def print_colored(message: str, color: str = Colors.NC):
     """Print colorized message"""
-    print(f"{color}{message}{Colors.NC}")
+    sys.stdout.write(color + message + _SUFFIX)
 
 
 def print_step(step: str):
     """Print step with formatting"""
-    print_colored(f"\n🔧 {step}", Colors.BLUE)
+    sys.stdout.write(_STEP_PREFIX + step + _SUFFIX)
+    # Fora de um terminal stdout usa buffer de bloco; esvaziar a cada etapa mantém a ordem com a
+    # saída dos subprocessos que escrevem direto no mesmo descritor
+    sys.stdout.flush()
 
 
 def print_success(message: str):
     """Print success message"""
-    print_colored(f"✅ {message}", Colors.GREEN)
+    sys.stdout.write(_SUCCESS_PREFIX + message + _SUFFIX)
 
 
 def print_warning(message: str):
     """Print warning message"""
-    print_colored(f"⚠️  {message}", Colors.YELLOW)
+    sys.stdout.write(_WARNING_PREFIX + message + _SUFFIX)
 
 
 def print_error(message: str):
     """Print error message"""
-    print_colored(f"❌ {message}", Colors.RED)
+    sys.stdout.write(_ERROR_PREFIX + message + _SUFFIX)
 
 
 def print_info(message: str):
     """Print info message"""
-    print_colored(f"ⓘ  {message}", Colors.CYAN)
+    sys.stdout.write(_INFO_PREFIX + message + _SUFFIX)
+
+
+def command_succeeds(command: list[str], timeout: float) -> bool:
+    """Executa um comando de verificação, retornando se terminou com sucesso"""
+    return subprocess.run(command, capture_output=True, text=True, timeout=timeout, check=False).returncode == 0
+
+
+def pump_service_output(stream, log_path: Path, ready_markers: tuple[bytes, ...], ready_event: threading.Event):
+    """Copia a saída de um serviço para o log, sinalizando ready_event ao encontrar um dos marcadores"""
+    with stream, log_path.open("ab", buffering=0) as log_file:
+        for line in iter(stream.readline, b""):
+            log_file.write(line)
+            if not ready_event.is_set() and any(marker in line for marker in ready_markers):
+                ready_event.set()
+
+    # Saída encerrada (o processo terminou): acorda quem espera, que confere o estado do processo
+    ready_event.set()
+
+
+def wait_and_signal(process: subprocess.Popen, exited: threading.Event):
+    """Aguarda o processo terminar e sinaliza exited"""
+    process.wait()
+    exited.set()
+
+
+@dataclass(slots=True)
+class Service:
+    """Processo de longa duração iniciado pelo script (backend ou frontend)"""
+
+    name: str
+    process: subprocess.Popen
+    pid: int
+
+
+class ProbeCache:
+    """
+    Resultados de verificações do sistema (docker, rede) reaproveitados entre execuções
+
+    Apenas verificações bem-sucedidas são guardadas, então uma falha é sempre verificada de novo.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # Verificações podem rodar em threads paralelas
+        self.lock = threading.Lock()
+        try:
+            import json
+
+            self.entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def tool_key(tool_path: str, *args: str) -> str:
+        """Chave de uma verificação de ferramenta, que muda quando o executável é atualizado"""
+        try:
+            mtime_ns = Path(tool_path).stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        return " ".join([tool_path, *args, str(mtime_ns)])
+
+    def check(self, key: str, ttl: float, probe) -> bool:
+        """Retorna True se a verificação passou há menos de ttl segundos, senão executa probe()"""
+        checked_at = self.entries.get(key)
+        if checked_at is not None and time.time() - checked_at < ttl:
+            return True
+
+        if not probe():
+            return False
+
+        import json
+
+        with self.lock:
+            self.entries[key] = time.time()
+            # O cache é só uma otimização, falhas de escrita são ignoradas
+            with contextlib.suppress(OSError):
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps(self.entries), encoding="utf-8")
+        return True
 
 
 class OpenManusSetup:
@@ -75,11 +215,26 @@ class OpenManusSetup:
         self.args = args
         self.project_root = Path(__file__).parent.absolute()
         self.venv_path = self.project_root / ".venv"
+        self.logs_dir = self.project_root / "logs"
         self.python_executable = None
-        self.services_pids = {}
+        self.services: list[Service] = []
+        # uv (quando instalado) cria o venv e instala pacotes bem mais rápido que venv/pip
+        self.uv = shutil.which("uv")
+        self.probe_cache = ProbeCache(PROBE_CACHE_FILE)
+        # Erros de import por módulo (None se OK) já verificados no venv
+        self.import_errors = {}
+        # Sinalizado quando o uvicorn anuncia que está pronto (ou quando sua saída termina)
+        self.backend_ready = threading.Event()
+        # Conteúdo de frontend/package.json, lido uma única vez (bytes e JSON)
+        self._package_json_raw = None
+        self._package_json = None
+        # Trabalho em segundo plano durante a preparação do Python
+        self.external_probes = None
+        self.frontend_install = None
+        self.frontend_install_stamp = None
 
         # Configurações
-        self.required_python_version = (3, 8)
+        self.required_python_version = REQUIRED_PYTHON_VERSION
         self.required_packages = [
             "fastapi",
             "uvicorn",
@@ -113,6 +268,12 @@ class OpenManusSetup:
             # Verificações de sistema
             self.check_system_requirements()
 
+            # Verificações de rede/Docker e a instalação do frontend rodam em segundo plano,
+            # em paralelo com a preparação do ambiente Python
+            self.start_external_probes()
+            if not self.args.backend_only:
+                self.setup_frontend()
+
             # Setup do ambiente Python
             self.setup_python_environment()
 
@@ -122,9 +283,8 @@ class OpenManusSetup:
             # Verificação do projeto
             self.verify_project_structure()
 
-            # Setup do frontend (se necessário)
-            if not self.args.backend_only:
-                self.setup_frontend()
+            # Aguardar a instalação do frontend (se iniciada)
+            self.wait_frontend_install()
 
             # Verificação dos serviços externos
             self.check_external_services()
@@ -144,6 +304,11 @@ class OpenManusSetup:
             print_error(f"Erro durante setup: {e!s}")
             self.cleanup()
             sys.exit(1)
+        except SystemExit:
+            # sys.exit() de uma etapa do setup: não deixar a instalação do frontend rodando
+            if self.frontend_install is not None:
+                self.cleanup()
+            raise
 
     def check_system_requirements(self):
         """Verifica requisitos do sistema"""
@@ -177,14 +342,21 @@ class OpenManusSetup:
             print_warning("git não encontrado (opcional)")
 
         # Verificar sistema operacional
+        import platform
+
         system = platform.system()
         print_success(f"Sistema operacional: {system} ✓")
 
         # Verificar Docker (opcional)
-        if shutil.which("docker"):
+        docker = shutil.which("docker")
+        if docker:
             try:
-                result = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=5, check=False)
-                if result.returncode == 0:
+                docker_ok = self.probe_cache.check(
+                    ProbeCache.tool_key(docker, "--version"),
+                    TOOL_PROBE_TTL,
+                    lambda: command_succeeds([docker, "--version"], timeout=5),
+                )
+                if docker_ok:
                     print_success("Docker ✓")
                 else:
                     print_warning("Docker instalado mas não funcional")
@@ -206,18 +378,56 @@ class OpenManusSetup:
                 shutil.rmtree(self.venv_path)
 
             print_info("Criando ambiente virtual...")
-            venv.create(self.venv_path, with_pip=True)
-            self.python_executable = self.get_venv_python()
+            if self.create_venv_with_uv():
+                self.python_executable = self.get_venv_python()
+            else:
+                import venv
 
-            # Atualizar pip
-            print_info("Atualizando pip...")
-            self.run_venv_command([self.python_executable, "-m", "pip", "install", "--upgrade", "pip"])
+                venv.create(self.venv_path, with_pip=True)
+                self.python_executable = self.get_venv_python()
+
+                # Atualizar pip
+                print_info("Atualizando pip...")
+                self.run_venv_command([self.python_executable, "-m", "pip", "install", "--upgrade", "pip"])
 
         print_success(f"Ambiente Python configurado: {self.python_executable}")
 
+    def create_venv_with_uv(self) -> bool:
+        """Cria o ambiente virtual com uv, retornando False para usar venv como fallback"""
+        if not self.uv:
+            return False
+
+        try:
+            result = subprocess.run(
+                [
+                    self.uv,
+                    "venv",
+                    "--seed",  # Inclui pip no venv, como venv.create(with_pip=True)
+                    "--python",
+                    sys.executable,
+                    "--python-preference",
+                    "only-system",  # Não baixar interpretadores gerenciados pelo uv
+                    str(self.venv_path),
+                ],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except subprocess.SubprocessError as e:
+            print_warning(f"Erro ao executar uv: {e} - usando venv")
+            return False
+
+        if result.returncode != 0:
+            print_warning(f"uv venv falhou - usando venv:\n{result.stderr}")
+            shutil.rmtree(self.venv_path, ignore_errors=True)
+            return False
+
+        print_info("Ambiente virtual criado com uv")
+        return True
+
     def get_venv_python(self) -> str:
         """Retorna o caminho do executável Python no venv"""
-        if platform.system() == "Windows":
+        if sys.platform == "win32":
             return str(self.venv_path / "Scripts" / "python.exe")
         return str(self.venv_path / "bin" / "python")
 
@@ -226,8 +436,16 @@ class OpenManusSetup:
         env = os.environ.copy()
         env["VIRTUAL_ENV"] = str(self.venv_path)
         env["PATH"] = f"{self.venv_path / 'bin'}:{env['PATH']}"
+        # Um PIP_CACHE_DIR definido pelo usuário (ex.: volume de cache do CI) tem precedência
+        env.setdefault("PIP_CACHE_DIR", str(PIP_CACHE_DIR))
         return subprocess.run(command, env=env, **kwargs, check=False)
 
+    def pip_install_command(self, *args: str) -> list[str]:
+        """Comando para instalar pacotes no venv, via uv pip quando disponível"""
+        if self.uv:
+            return [self.uv, "pip", "install", "--python", self.python_executable, *args]
+        return [self.python_executable, "-m", "pip", "install", *args]
+
     def install_dependencies(self):
         """Instala dependências Python"""
         print_step("Instalando dependências Python")
@@ -237,17 +455,35 @@ class OpenManusSetup:
             print_error("requirements.txt não encontrado")
             sys.exit(1)
 
-        print_info("Instalando pacotes do requirements.txt...")
+        # Um lockfile com hashes dispensa a resolução de dependências
+        lock_file = self.project_root / "requirements.lock"
+        install_file = lock_file if lock_file.exists() else requirements_file
+
+        # Nada mudou desde a última instalação verificada: pular instalação e verificação
+        stamp_file = self.venv_path / ".openmanus_stamp"
+        stamp = self.dependencies_hash(install_file)
+        if not self.args.force_reinstall and self.read_stamp(stamp_file) == stamp:
+            print_success("Dependências inalteradas desde a última instalação - pulando")
+            return
+
+        if install_file is lock_file:
+            print_info("Instalando pacotes do requirements.lock...")
+            install_args = ["--require-hashes", "-r", str(lock_file)]
+        else:
+            print_info("Instalando pacotes do requirements.txt...")
+            install_args = ["-r", str(requirements_file)]
+
         try:
+            if self.uv:
+                # uv não gera .pyc por padrão; compilar agora evita o custo no primeiro import
+                install_args.append("--compile-bytecode")
+            else:
+                # uv usa seu próprio cache global; o do pip fica em PIP_CACHE_DIR
+                print_info(f"Cache do pip: {os.environ.get('PIP_CACHE_DIR', PIP_CACHE_DIR)}")
+                install_args.append("--prefer-binary")
+
             result = self.run_venv_command(
-                [
-                    self.python_executable,
-                    "-m",
-                    "pip",
-                    "install",
-                    "-r",
-                    str(requirements_file),
-                ],
+                self.pip_install_command(*install_args),
                 capture_output=True,
                 text=True,
             )
@@ -263,31 +499,65 @@ class OpenManusSetup:
             sys.exit(1)
 
         # Verificar instalação dos pacotes principais
-        self.verify_python_packages()
-
-    def verify_python_packages(self):
-        """Verifica se os pacotes principais estão instalados"""
+        if self.verify_python_packages():
+            # O stamp é só uma otimização, falhas de escrita são ignoradas
+            with contextlib.suppress(OSError):
+                stamp_file.write_text(stamp, encoding="utf-8")
+
+    def dependencies_hash(self, install_file: Path) -> str:
+        """Hash de tudo que define o venv instalado: requisitos, pacotes verificados e interpretador"""
+        import platform
+
+        digest = hashlib.sha256(install_file.read_bytes())
+        digest.update("\n".join(self.required_packages).encode())
+        digest.update(f"{self.python_executable}\n{sys.version}\n{platform.platform()}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def read_stamp(stamp_file: Path) -> str | None:
+        """Conteúdo do stamp da última instalação, None se não existir"""
+        try:
+            return stamp_file.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def probe_imports(self, modules: list[str], **kwargs) -> dict[str, str | None]:
+        """Importa os módulos em um único subprocesso do venv, retornando o erro de cada um (None se OK)"""
+        script = "".join(IMPORT_PROBE_TEMPLATE.format(module=module) for module in modules)
+        result = self.run_venv_command([self.python_executable, "-c", script], capture_output=True, text=True, **kwargs)
+
+        # Módulos sem resposta (ex.: o interpretador morreu no meio) contam como falha
+        errors = dict.fromkeys(modules, result.stderr.strip() or "sem resposta do interpretador")
+        for line in result.stdout.splitlines():
+            status, _, rest = line.partition(":")
+            if status == "OK" and rest in errors:
+                errors[rest] = None
+            elif status == "FAIL":
+                module, _, error = rest.partition(":")
+                if module in errors:
+                    errors[module] = error
+        return errors
+
+    def verify_python_packages(self) -> bool:
+        """Verifica se os pacotes principais estão instalados, retornando se todos estão disponíveis"""
         print_info("Verificando pacotes instalados...")
 
-        missing_packages = []
-        for package in self.required_packages:
-            try:
-                result = self.run_venv_command(
-                    [
-                        self.python_executable,
-                        "-c",
-                        f"import {package.replace('-', '_')}",
-                    ],
-                    capture_output=True,
-                )
-
-                if result.returncode == 0:
-                    print_colored(f"  {package} ✓", Colors.GREEN)
-                else:
-                    missing_packages.append(package)
-                    print_colored(f"  {package} ✗", Colors.RED)
+        # Um único interpretador importa todos os pacotes, em vez de um subprocesso por pacote.
+        # O módulo app é testado junto e o resultado reaproveitado em verify_project_structure.
+        modules = {
+            package: PACKAGE_IMPORT_NAMES.get(package, package.replace("-", "_")) for package in self.required_packages
+        }
+        try:
+            errors = self.probe_imports([*modules.values(), "app"], cwd=self.project_root)
+            self.import_errors.update(errors)
+        except Exception as e:
+            errors = dict.fromkeys(modules.values(), str(e))
 
-            except Exception:
+        missing_packages = []
+        for package, module in modules.items():
+            if errors[module] is None:
+                print_colored(f"  {package} ✓", Colors.GREEN)
+            else:
                 missing_packages.append(package)
                 print_colored(f"  {package} ✗", Colors.RED)
 
@@ -295,12 +565,33 @@ class OpenManusSetup:
             print_warning(f"Pacotes faltando: {', '.join(missing_packages)}")
             print_info("Tentando instalar pacotes faltando...")
 
+            # O import de app pode ter falhado pelos pacotes faltando, testar de novo depois
+            self.import_errors.pop("app", None)
+
+            # Uma única instalação resolve todos os pacotes juntos
+            try:
+                result = self.run_venv_command(
+                    self.pip_install_command(*missing_packages), capture_output=True, text=True
+                )
+                if result.returncode != 0:
+                    print_warning(f"Erro ao instalar pacotes faltando:\n{result.stderr.strip()}")
+
+                # Resultado por pacote: um novo probe dos faltando (também em um único interpretador)
+                errors = self.probe_imports([modules[package] for package in missing_packages])
+            except Exception as e:
+                print_warning(f"Não foi possível instalar {', '.join(missing_packages)}: {e}")
+                return False
+
+            still_missing = []
             for package in missing_packages:
-                try:
-                    self.run_venv_command([self.python_executable, "-m", "pip", "install", package])
+                if errors[modules[package]] is None:
                     print_success(f"Instalado: {package}")
-                except Exception as e:
-                    print_warning(f"Não foi possível instalar {package}: {e}")
+                else:
+                    still_missing.append(package)
+                    print_warning(f"Não foi possível instalar {package}: {errors[modules[package]]}")
+            return not still_missing
+
+        return True
 
     def verify_project_structure(self):
         """Verifica estrutura do projeto"""
@@ -309,34 +600,33 @@ class OpenManusSetup:
         required_dirs = ["app", "tests", "config"]
         required_files = ["main.py", "requirements.txt"]
 
+        # Uma única listagem da raiz do projeto em vez de um stat() por caminho
+        with os.scandir(self.project_root) as entries:
+            root_entries = {entry.name: entry.is_dir() for entry in entries}
+
         for directory in required_dirs:
-            dir_path = self.project_root / directory
-            if dir_path.exists():
+            if root_entries.get(directory):
                 print_success(f"Diretório {directory}/ ✓")
             else:
                 print_error(f"Diretório {directory}/ não encontrado")
                 sys.exit(1)
 
         for file in required_files:
-            file_path = self.project_root / file
-            if file_path.exists():
+            if file in root_entries:
                 print_success(f"Arquivo {file} ✓")
             else:
                 print_warning(f"Arquivo {file} não encontrado")
 
-        # Verificar se o módulo app pode ser importado
+        # Verificar se o módulo app pode ser importado (normalmente já testado com os pacotes)
         try:
-            result = self.run_venv_command(
-                [self.python_executable, "-c", "import app; print('App module OK')"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-            )
+            if "app" not in self.import_errors:
+                self.import_errors.update(self.probe_imports(["app"], cwd=self.project_root))
 
-            if result.returncode == 0:
+            app_error = self.import_errors["app"]
+            if app_error is None:
                 print_success("Módulo app importável ✓")
             else:
-                print_error(f"Erro ao importar módulo app:\n{result.stderr}")
+                print_error(f"Erro ao importar módulo app:\n{app_error}")
                 # Adicionar PYTHONPATH
                 self.setup_pythonpath()
 
@@ -373,55 +663,139 @@ class OpenManusSetup:
             return
 
         # Verificar package.json
-        package_json = frontend_dir / "package.json"
-        if not package_json.exists():
+        package_json_raw = self.read_package_json()
+        if package_json_raw is None:
             print_warning("package.json não encontrado - pulando configuração frontend")
             return
 
         # Instalar dependências do frontend
-        node_modules = frontend_dir / "node_modules"
-        if not node_modules.exists() or self.args.force_reinstall:
-            print_info("Instalando dependências do frontend...")
+        installer, lock_file = self.frontend_installer(frontend_dir)
+        stamp_file = frontend_dir / "node_modules" / ".openmanus_stamp"
+        digest = hashlib.sha256(installer.encode())
+        digest.update(package_json_raw)
+        if lock_file is not None:
+            digest.update(lock_file.read_bytes())
+        stamp = digest.hexdigest()
+
+        if self.args.force_reinstall or self.read_stamp(stamp_file) != stamp:
+            print_info(f"Instalando dependências do frontend com {installer} em segundo plano...")
+            print_info("Acompanhe com: tail -f logs/frontend-install.log")
             try:
-                result = subprocess.run(
-                    ["npm", "install"],
-                    cwd=frontend_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                    check=False,  # 5 minutos
-                )
-
-                if result.returncode == 0:
-                    print_success("Dependências do frontend instaladas")
-                else:
-                    print_warning(f"Erro ao instalar dependências do frontend:\n{result.stderr}")
+                # Roda em paralelo com a instalação do Python; a saída vai para o log para não se
+                # misturar com a do setup. O resultado é conferido em wait_frontend_install.
+                self.logs_dir.mkdir(exist_ok=True)
+                with (self.logs_dir / "frontend-install.log").open("wb") as log_file:
+                    self.frontend_install = subprocess.Popen(
+                        [installer, "install"], cwd=frontend_dir, stdout=log_file, stderr=subprocess.STDOUT
+                    )
+                self.frontend_install_stamp = (stamp_file, stamp)
 
-            except subprocess.TimeoutExpired:
-                print_warning("Timeout ao instalar dependências do frontend")
-            except subprocess.SubprocessError as e:
-                print_warning(f"Erro ao executar npm: {e}")
+            except (OSError, subprocess.SubprocessError) as e:
+                print_warning(f"Erro ao executar {installer}: {e}")
         else:
             print_success("Dependências do frontend já instaladas")
 
+    def wait_frontend_install(self):
+        """Aguarda a instalação do frontend iniciada em setup_frontend, se houver"""
+        if self.frontend_install is None:
+            return
+
+        print_info("Aguardando instalação das dependências do frontend...")
+        returncode = self.frontend_install.wait()
+        self.frontend_install = None
+
+        if returncode == 0:
+            print_success("Dependências do frontend instaladas")
+            stamp_file, stamp = self.frontend_install_stamp
+            with contextlib.suppress(OSError):
+                stamp_file.write_text(stamp, encoding="utf-8")
+        else:
+            print_warning(
+                f"Erro ao instalar dependências do frontend (código {returncode}), veja logs/frontend-install.log"
+            )
+
+    def read_package_json(self) -> bytes | None:
+        """Conteúdo de frontend/package.json, lido do disco só na primeira chamada (None se não existir)"""
+        if self._package_json_raw is None:
+            try:
+                self._package_json_raw = (self.project_root / "frontend" / "package.json").read_bytes()
+            except OSError:
+                return None
+        return self._package_json_raw
+
+    def load_package_json(self) -> dict | None:
+        """frontend/package.json já decodificado, None se não existir"""
+        if self._package_json is None:
+            raw = self.read_package_json()
+            if raw is None:
+                return None
+            try:
+                from orjson import loads as json_loads
+            except ImportError:
+                from json import loads as json_loads
+
+            self._package_json = json_loads(raw)
+        return self._package_json
+
+    @staticmethod
+    def frontend_installer(frontend_dir: Path) -> tuple[str, Path | None]:
+        """Gerenciador de pacotes do frontend e seu lockfile, conforme o lockfile presente"""
+        for lock_name, installer in FRONTEND_LOCKFILES:
+            lock_file = frontend_dir / lock_name
+            if lock_file.exists() and shutil.which(installer):
+                return installer, lock_file
+        return "npm", None
+
+    def start_external_probes(self):
+        """Inicia em segundo plano as verificações de check_external_services"""
+        from concurrent.futures import ThreadPoolExecutor
+        import socket
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="probe")
+        # Verificar conectividade de rede: só a resolução DNS do índice de pacotes, sem requisição HTTP
+        self.external_probes = {
+            "network": executor.submit(
+                self.probe_cache.check,
+                "network pypi.org",
+                NETWORK_PROBE_TTL,
+                lambda: bool(socket.getaddrinfo("pypi.org", 443, type=socket.SOCK_STREAM)),
+            )
+        }
+
+        # Verificar Docker daemon
+        docker = shutil.which("docker")
+        if docker:
+            self.external_probes["docker"] = executor.submit(
+                self.probe_cache.check,
+                ProbeCache.tool_key(docker, "ps"),
+                DOCKER_DAEMON_PROBE_TTL,
+                lambda: command_succeeds([docker, "ps"], timeout=10),
+            )
+
+        # As verificações já enviadas terminam sozinhas; os resultados são lidos dos futures
+        executor.shutdown(wait=False)
+
     def check_external_services(self):
         """Verifica serviços externos necessários"""
         print_step("Verificando serviços externos")
 
-        # Verificar conectividade de rede
-        try:
-            import urllib.request
+        if self.external_probes is None:
+            self.start_external_probes()
 
-            urllib.request.urlopen("http://google.com", timeout=5)
+        try:
+            network_ok = self.external_probes["network"].result()
+        except OSError:
+            network_ok = False
+        if network_ok:
             print_success("Conectividade de rede ✓")
-        except Exception:
+        else:
             print_warning("Sem conectividade de rede - algumas funcionalidades podem não funcionar")
 
-        # Verificar Docker daemon
-        if shutil.which("docker"):
+        docker_probe = self.external_probes.get("docker")
+        if docker_probe is not None:
             try:
-                result = subprocess.run(["docker", "ps"], capture_output=True, text=True, timeout=10, check=False)
-                if result.returncode == 0:
+                daemon_ok = docker_probe.result()
+                if daemon_ok:
                     print_success("Docker daemon ativo ✓")
                 else:
                     print_warning("Docker daemon não está rodando")
@@ -492,18 +866,29 @@ print('FastAPI app created successfully')
         """Inicia o sistema OpenManus"""
         print_step("Iniciando sistema OpenManus")
 
-        # Setup signal handlers
+        if self.args.embed:
+            self.exec_backend()
+
+        # Setup signal handlers. Os serviços rodam em sessão própria e não recebem os sinais do
+        # terminal (incluindo SIGHUP ao fechá-lo), então o script precisa pará-los ao sair.
+        import signal
+
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.signal_handler)
 
         try:
             # Iniciar backend
-            self.start_backend()
+            backend = self.start_backend()
 
-            # Aguardar backend inicializar
-            time.sleep(3)
+            # Aguardar o uvicorn anunciar que está pronto, em vez de um tempo fixo
+            self.backend_ready.wait(timeout=BACKEND_READY_TIMEOUT)
+            if backend.process.poll() is not None:
+                print_error("Backend encerrou durante a inicialização (veja logs/backend.log)")
+                return
 
-            # Verificar se backend está rodando
+            # Verificar se backend está rodando (imediato quando o banner já apareceu)
             if not self.check_backend_health():
                 print_error("Backend não está respondendo")
                 return
@@ -521,37 +906,60 @@ print('FastAPI app created successfully')
 
         except Exception as e:
             print_error(f"Erro ao iniciar sistema: {e}")
+        finally:
+            # Qualquer saída (serviço morto, backend sem resposta, sinal) para os demais serviços
             self.cleanup()
 
-    def start_backend(self):
+    def backend_command(self) -> list[str]:
+        """Comando para iniciar uvicorn (loop padrão "auto": usa uvloop quando instalado)"""
+        return [
+            self.python_executable,
+            "-m",
+            "uvicorn",
+            "app.api.main:app",
+            "--reload",
+            "--host",
+            "0.0.0.0",
+            "--port",
+            "8000",
+            "--ws-per-message-deflate",
+            "false",
+        ]
+
+    def exec_backend(self):
+        """
+        Substitui o processo deste script pelo backend, sem um supervisor residente (não retorna)
+
+        O uvicorn passa a receber Ctrl+C diretamente e a saída vai para o terminal em vez de logs/.
+        Nenhum cleanup() é feito, de propósito: com --backend-only não há instalação do frontend nem
+        serviços iniciados para parar, e depois do exec não resta supervisor; o próprio uvicorn trata
+        os sinais e encerra seus processos.
+        """
+        print_info("Iniciando backend FastAPI no lugar deste processo...")
+        sys.stdout.flush()
+        os.chdir(self.project_root)
+        # Executável e argumentos fixos (backend_command), sem shell envolvido
+        os.execve(self.python_executable, self.backend_command(), self.get_env_with_pythonpath())  # noqa: S606
+
+    def start_backend(self) -> Service:
         """Inicia o backend FastAPI"""
         print_info("Iniciando backend FastAPI...")
 
         try:
-            # Comando para iniciar uvicorn
-            cmd = [
-                self.python_executable,
-                "-m",
-                "uvicorn",
-                "app.api.main:app",
-                "--reload",
-                "--host",
-                "0.0.0.0",
-                "--port",
-                "8000",
-            ]
-
             # Iniciar processo
-            process = subprocess.Popen(
-                cmd,
+            process = self.spawn_service(
+                "backend",
+                self.backend_command(),
+                ready_event=self.backend_ready,
+                ready_markers=BACKEND_READY_MARKERS,
                 cwd=self.project_root,
                 env=self.get_env_with_pythonpath(),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
             )
 
-            self.services_pids["backend"] = process
-            print_success(f"Backend iniciado (PID: {process.pid})")
+            service = Service("backend", process, process.pid)
+            self.services.append(service)
+            print_success(f"Backend iniciado (PID: {service.pid}, logs em logs/backend.log)")
+            return service
 
         except Exception as e:
             print_error(f"Erro ao iniciar backend: {e}")
@@ -571,35 +979,62 @@ print('FastAPI app created successfully')
         print_info("Iniciando frontend...")
 
         try:
-            # Verificar se há script dev
-            package_json = frontend_dir / "package.json"
-            if package_json.exists():
-                with package_json.open() as f:
-                    package_data = json.load(f)
-                    scripts = package_data.get("scripts", {})
-
-                    if "dev" in scripts:
-                        cmd = ["npm", "run", "dev"]
-                    elif "start" in scripts:
-                        cmd = ["npm", "start"]
-                    else:
-                        print_warning("Script de desenvolvimento não encontrado no package.json")
-                        return
-
-                    # Iniciar processo
-                    process = subprocess.Popen(
-                        cmd,
-                        cwd=frontend_dir,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
+            # Verificar se há script dev (package.json já lido em setup_frontend)
+            package_data = self.load_package_json()
+            if package_data is not None:
+                scripts = package_data.get("scripts", {})
+
+                if "dev" in scripts:
+                    cmd = ["npm", "run", "dev"]
+                elif "start" in scripts:
+                    cmd = ["npm", "start"]
+                else:
+                    print_warning("Script de desenvolvimento não encontrado no package.json")
+                    return
 
-                    self.services_pids["frontend"] = process
-                    print_success(f"Frontend iniciado (PID: {process.pid})")
+                # Iniciar processo
+                process = self.spawn_service("frontend", cmd, cwd=frontend_dir)
+
+                self.services.append(Service("frontend", process, process.pid))
+                print_success(f"Frontend iniciado (PID: {process.pid}, logs em logs/frontend.log)")
 
         except Exception as e:
             print_warning(f"Erro ao iniciar frontend: {e}")
 
+    def spawn_service(
+        self,
+        service: str,
+        cmd: list[str],
+        ready_event: threading.Event | None = None,
+        ready_markers: tuple[bytes, ...] = (),
+        **kwargs,
+    ) -> subprocess.Popen:
+        """
+        Inicia um serviço de longa duração com a saída gravada em logs/<service>.log
+
+        Sem ready_event a saída vai direto para o arquivo: um PIPE nunca lido encheria e travaria o
+        processo. Com ready_event, uma thread copia a saída para o log e sinaliza o evento ao ver um
+        dos ready_markers.
+        """
+        self.logs_dir.mkdir(exist_ok=True)
+        log_path = self.logs_dir / f"{service}.log"
+        # Grupo de processos próprio: Ctrl+C chega só ao script, que para o grupo inteiro no cleanup
+        popen_kwargs = {"stderr": subprocess.STDOUT, "start_new_session": True, **kwargs}
+
+        if ready_event is None:
+            with log_path.open("ab", buffering=0) as log_file:
+                # O filho herda o descritor, o pai pode fechar o arquivo logo após o spawn
+                return subprocess.Popen(cmd, stdout=log_file, **popen_kwargs)
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, **popen_kwargs)
+        threading.Thread(
+            target=pump_service_output,
+            args=(process.stdout, log_path, ready_markers, ready_event),
+            name=f"{service}-output",
+            daemon=True,
+        ).start()
+        return process
+
     def check_backend_health(self) -> bool:
         """Verifica se o backend está respondendo"""
         try:
@@ -639,7 +1074,7 @@ print('FastAPI app created successfully')
         print_colored("  • Documentação API: http://localhost:8000/docs", Colors.CYAN)
         print_colored("  • Redoc: http://localhost:8000/redoc", Colors.CYAN)
 
-        if "frontend" in self.services_pids:
+        if any(service.name == "frontend" for service in self.services):
             print_colored(
                 "  • Frontend: http://localhost:3000 (ou próxima porta disponível)",
                 Colors.CYAN,
@@ -653,52 +1088,74 @@ print('FastAPI app created successfully')
         print_colored("\n" + "=" * 60, Colors.WHITE)
 
     def wait_for_services(self):
-        """Aguarda pelos serviços"""
+        """Aguarda pelos serviços, até que algum deles termine"""
+        # Uma thread bloqueada em wait() por serviço acorda o loop assim que um processo morre
+        service_exited = threading.Event()
+        for service in self.services:
+            threading.Thread(
+                target=wait_and_signal, args=(service.process, service_exited), name=f"{service.name}-wait", daemon=True
+            ).start()
+
+        # No Windows, Event.wait() sem timeout não é interrompido por Ctrl+C
+        timeout = 5 if sys.platform == "win32" else None
         try:
-            while True:
-                # Verificar se algum processo morreu
-                dead_services = []
-                for service, process in self.services_pids.items():
-                    if process.poll() is not None:
-                        dead_services.append(service)
+            while not service_exited.wait(timeout):
+                pass
 
-                if dead_services:
-                    print_warning(f"Serviços mortos: {', '.join(dead_services)}")
-                    break
-
-                time.sleep(1)
+            # Verificar quais processos morreram
+            dead_services = [service.name for service in self.services if service.process.poll() is not None]
+            print_warning(f"Serviços mortos: {', '.join(dead_services)}")
 
         except KeyboardInterrupt:
             pass
 
     def signal_handler(self, _signum, _frame):
-        """Handler para sinais do sistema"""
+        """Handler para sinais do sistema (o cleanup roda no finally de start_system)"""
         print_warning("\nRecebido sinal de interrupção")
-        self.cleanup()
         sys.exit(0)
 
+    @staticmethod
+    def signal_service(service: Service, sig: int):
+        """Envia um sinal ao grupo de processos do serviço (reloader do uvicorn, filhos do npm)"""
+        if hasattr(os, "killpg"):
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(service.pid, sig)
+        else:
+            service.process.send_signal(sig)
+
     def cleanup(self):
         """Limpa recursos e para serviços"""
+        import signal
+
         print_step("Parando serviços...")
 
-        for service, process in self.services_pids.items():
+        if self.frontend_install is not None and self.frontend_install.poll() is None:
+            print_info("Interrompendo instalação do frontend...")
+            self.frontend_install.terminate()
+            try:
+                self.frontend_install.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.frontend_install.kill()
+                self.frontend_install.wait()
+
+        for service in self.services:
             try:
-                if process.poll() is None:  # Processo ainda está rodando
-                    print_info(f"Parando {service} (PID: {process.pid})...")
-                    process.terminate()
+                if service.process.poll() is None:  # Processo ainda está rodando
+                    print_info(f"Parando {service.name} (PID: {service.pid})...")
+                    self.signal_service(service, signal.SIGTERM)
 
                     # Aguardar um pouco para terminar graciosamente
                     try:
-                        process.wait(timeout=5)
+                        service.process.wait(timeout=5)
                     except subprocess.TimeoutExpired:
-                        print_warning(f"Forçando parada do {service}...")
-                        process.kill()
-                        process.wait()
+                        print_warning(f"Forçando parada do {service.name}...")
+                        self.signal_service(service, getattr(signal, "SIGKILL", signal.SIGTERM))
+                        service.process.wait()
 
-                    print_success(f"{service} parado")
+                    print_success(f"{service.name} parado")
 
             except Exception as e:
-                print_warning(f"Erro ao parar {service}: {e}")
+                print_warning(f"Erro ao parar {service.name}: {e}")
 
         print_success("Cleanup concluído")
 
@@ -712,6 +1169,7 @@ def main():
 Exemplos de uso:
   python setup_and_run.py                    # Setup completo e inicialização
   python setup_and_run.py --backend-only     # Apenas backend
+  python setup_and_run.py --backend-only --embed  # Backend sem processo supervisor
   python setup_and_run.py --skip-tests       # Pula verificações
   python setup_and_run.py --force-reinstall  # Força reinstalação
         """,
@@ -731,7 +1189,15 @@ Exemplos de uso:
         help="Força reinstalação das dependências",
     )
 
+    parser.add_argument(
+        "--embed",
+        action="store_true",
+        help="Com --backend-only, o backend substitui o processo deste script (sem supervisor)",
+    )
+
     args = parser.parse_args()
+    if args.embed and not args.backend_only:
+        parser.error("--embed requer --backend-only")
 
     # Criar e executar setup
     setup = OpenManusSetup(args)
@@ -36,7 +36,7 @@ fi
 start_backend() {
     echo -e "${GREEN}Starting FastAPI backend on port 8000...${NC}"
     cd "$(dirname "$0")"
-    python -m uvicorn app.api.main:app --reload --port 8000 &
+    python -m uvicorn app.api.main:app --reload --port 8000 --ws-per-message-deflate false &
     BACKEND_PID=$!
     echo $BACKEND_PID > .backend.pid
     echo -e "${GREEN}Backend started with PID: $BACKEND_PID${NC}"
@@ -10,31 +10,62 @@ Uso:
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 import importlib.util
 from pathlib import Path
 import sys
+from typing import ClassVar
 
 # Adicionar o diretório raiz ao path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 
+@cache
+def find_spec(module_name):
+    """(spec, erro) de um módulo, sem importá-lo; memoizado por nome"""
+    try:
+        return importlib.util.find_spec(module_name), None
+    except Exception as e:
+        return None, e
+
+
+def find_specs(module_names):
+    """find_spec de vários módulos em paralelo (busca em sys.path), na ordem recebida"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(find_spec, module_names))
+
+
 class CoreFunctionalityTester:
+    _COLORS: ClassVar[dict[str, str]] = {
+        "success": "\033[92m✅",
+        "error": "\033[91m❌",
+        "warning": "\033[93m⚠️ ",
+        "info": "\033[94mi ",
+    }
+    _RESET = "\033[0m"
+
     def __init__(self):
         self.passed = 0
         self.failed = 0
         self.warnings = 0
+        # Saída acumulada e escrita de uma vez por fase em flush()
+        self._buf = []
+
+    def write(self, text=""):
+        """Acumular uma linha de saída."""
+        self._buf.append(f"{text}\n")
 
     def print_status(self, message, status="info"):
         """Print formatted status message."""
-        colors = {
-            "success": "\033[92m✅",
-            "error": "\033[91m❌",
-            "warning": "\033[93m⚠️ ",
-            "info": "\033[94mi ",
-        }
-        reset = "\033[0m"
-        print(f"{colors.get(status, '')} {message}{reset}")
+        self._buf.append(f"{self._COLORS.get(status, '')} {message}{self._RESET}\n")
+
+    def flush(self):
+        """Escrever a saída acumulada em uma única chamada."""
+        sys.stdout.write("".join(self._buf))
+        sys.stdout.flush()
+        self._buf.clear()
 
     def test_core_imports(self):
         """Teste importações essenciais."""
@@ -53,17 +84,17 @@ class CoreFunctionalityTester:
             ("pytest", "Testing framework"),
         ]
 
-        for module_name, description in core_imports:
-            try:
-                if importlib.util.find_spec(module_name) is not None:
-                    self.print_status(f"{description} ({module_name})", "success")
-                    self.passed += 1
-                else:
-                    msg = f"{description} ({module_name}) - Not found"
-                    self.print_status(msg, "error")
-                    self.failed += 1
-            except Exception as e:
-                msg = f"{description} ({module_name}) - Error: {e}"
+        specs = find_specs([module_name for module_name, _ in core_imports])
+        for (module_name, description), (spec, error) in zip(core_imports, specs, strict=True):
+            if error is not None:
+                msg = f"{description} ({module_name}) - Error: {error}"
+                self.print_status(msg, "error")
+                self.failed += 1
+            elif spec is not None:
+                self.print_status(f"{description} ({module_name})", "success")
+                self.passed += 1
+            else:
+                msg = f"{description} ({module_name}) - Not found"
                 self.print_status(msg, "error")
                 self.failed += 1
 
@@ -113,16 +144,14 @@ class CoreFunctionalityTester:
             ("docling", "Processamento avançado de documentos"),
         ]
 
-        for module_name, description in optional_features:
-            try:
-                if importlib.util.find_spec(module_name) is not None:
-                    msg = f"{description} ({module_name}) - Disponível"
-                    self.print_status(msg, "warning")
-                    self.warnings += 1
-                else:
-                    msg = f"{description} ({module_name}) - Não instalado (OK)"
-                    self.print_status(msg, "info")
-            except Exception:
+        specs = find_specs([module_name for module_name, _ in optional_features])
+        for (module_name, description), (spec, _error) in zip(optional_features, specs, strict=True):
+            # Erro ao localizar conta como não instalado
+            if spec is not None:
+                msg = f"{description} ({module_name}) - Disponível"
+                self.print_status(msg, "warning")
+                self.warnings += 1
+            else:
                 msg = f"{description} ({module_name}) - Não instalado (OK)"
                 self.print_status(msg, "info")
 
@@ -168,9 +197,9 @@ class CoreFunctionalityTester:
 
     def print_summary(self):
         """Imprimir resumo dos testes."""
-        print("\n" + "=" * 60)
+        self.write("\n" + "=" * 60)
         self.print_status("RESUMO DOS TESTES", "info")
-        print("=" * 60)
+        self.write("=" * 60)
 
         total = self.passed + self.failed
         success_rate = (self.passed / total * 100) if total > 0 else 0
@@ -181,7 +210,7 @@ class CoreFunctionalityTester:
         self.print_status(f"Avisos: {self.warnings}", "warning")
         self.print_status(f"Taxa de sucesso: {success_rate:.1f}%", "info")
 
-        print("\n" + "=" * 60)
+        self.write("\n" + "=" * 60)
 
         if self.failed == 0:
             self.print_status("🎉 TODOS OS TESTES CORE PASSARAM!", "success")
@@ -200,28 +229,35 @@ class CoreFunctionalityTester:
 
     async def run_all_tests(self):
         """Executar todos os testes."""
-        print("🧪 Testando Funcionalidade Core do OpenManus")
-        print("=" * 60)
-        print("Este teste verifica se o OpenManus funciona apenas")
-        print("com as dependências essenciais (requirements-core.txt)")
-        print("=" * 60)
+        self.write("🧪 Testando Funcionalidade Core do OpenManus")
+        self.write("=" * 60)
+        self.write("Este teste verifica se o OpenManus funciona apenas")
+        self.write("com as dependências essenciais (requirements-core.txt)")
+        self.write("=" * 60)
+        self.flush()
 
         self.test_core_imports()
-        print()
+        self.write()
+        self.flush()
 
         self.test_app_structure()
-        print()
+        self.write()
+        self.flush()
 
         await self.test_basic_api_functionality()
-        print()
+        self.write()
+        self.flush()
 
         await self.test_llm_integration()
-        print()
+        self.write()
+        self.flush()
 
         self.test_optional_features()
-        print()
+        self.write()
+        self.flush()
 
         self.print_summary()
+        self.flush()
 
 
 async def main():
@@ -231,4 +267,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (opcional, instalado junto com uvicorn[standard]) quando disponível
+    try:
+        from uvloop import new_event_loop as loop_factory
+    except ImportError:
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
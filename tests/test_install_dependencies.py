@@ -0,0 +1,121 @@
+"""
+Testes das funções de requirements do install_dependencies.py
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import install_dependencies
+from install_dependencies import merge_requirements, pending_requirements, requirement_key
+
+
+@pytest.fixture
+def write_requirements(tmp_path):
+    """Cria arquivos de requirements temporários a partir de listas de linhas"""
+
+    def write(*contents):
+        files = []
+        for i, lines in enumerate(contents):
+            file_path = tmp_path / f"requirements-{i}.txt"
+            file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            files.append(file_path)
+        return files
+
+    return write
+
+
+class TestRequirementKey:
+    """Testes da chave usada para detectar duplicatas"""
+
+    def test_name_is_canonicalized(self):
+        assert requirement_key("Duckduckgo_Search~=8.0") == ("duckduckgo-search", "~=8.0")
+
+    def test_extras_are_part_of_key(self):
+        assert requirement_key("uvicorn[standard]~=0.34") == ("uvicorn[standard]", "~=0.34")
+        assert requirement_key("pkg[b, A]") == ("pkg[a,b]", "")
+
+    def test_marker_is_part_of_key(self):
+        key, spec = requirement_key("numpy<2; python_version < '3.9'")
+        assert key == "numpy;python_version<'3.9'"
+        assert spec == "<2"
+
+    def test_url_is_keyed_by_whole_line(self):
+        line = "git+https://github.com/org/repo.git@main#egg=repo"
+        assert requirement_key(line) == (line, "")
+
+    def test_pip_option_is_keyed_by_whole_line(self):
+        assert requirement_key("--extra-index-url https://example.com") == ("--extra-index-url https://example.com", "")
+
+
+class TestMergeRequirements:
+    """Testes da junção dos arquivos de requirements"""
+
+    def test_duplicates_are_dropped(self, write_requirements):
+        files = write_requirements(["fastapi==0.115.9", "loguru~=0.7.3"], ["FastAPI == 0.115.9", "pyyaml"])
+        assert merge_requirements(files) == ["fastapi==0.115.9", "loguru~=0.7.3", "pyyaml"]
+
+    def test_conflict_keeps_first_and_reports(self, write_requirements, capsys):
+        files = write_requirements(["httpx>=0.27.0"], ["httpx<0.27"])
+        assert merge_requirements(files) == ["httpx>=0.27.0"]
+        assert "httpx<0.27" in capsys.readouterr().out
+
+    def test_comments_and_blank_lines_are_skipped(self, write_requirements):
+        files = write_requirements(["# comentário", "", "requests~=2.32.3  # HTTP"])
+        assert merge_requirements(files) == ["requests~=2.32.3"]
+
+    def test_markers_do_not_collide(self, write_requirements):
+        lines = ["numpy<2; python_version < '3.9'", "numpy>=2; python_version >= '3.9'"]
+        assert merge_requirements(write_requirements(lines)) == lines
+
+    def test_extras_do_not_collide(self, write_requirements):
+        files = write_requirements(["uvicorn~=0.34.3"], ["uvicorn[standard]~=0.34.3"])
+        assert merge_requirements(files) == ["uvicorn~=0.34.3", "uvicorn[standard]~=0.34.3"]
+
+    def test_git_urls_do_not_collide(self, write_requirements):
+        lines = [
+            "git+https://github.com/org/first.git#egg=first",
+            "git+https://github.com/org/second.git#egg=second",
+        ]
+        files = write_requirements(lines, lines[:1])
+        assert merge_requirements(files) == lines
+
+
+class TestPendingRequirements:
+    """Testes da remoção de requirements já satisfeitos"""
+
+    @pytest.fixture(autouse=True)
+    def installed(self, monkeypatch):
+        """Ambiente simulado com fastapi 0.115.9 e uvicorn 0.34.3 instalados"""
+        pytest.importorskip("packaging")
+        monkeypatch.setattr(
+            install_dependencies, "installed_versions", lambda: {"fastapi": "0.115.9", "uvicorn": "0.34.3"}
+        )
+
+    def test_satisfied_requirements_are_dropped(self):
+        assert pending_requirements(["fastapi==0.115.9", "uvicorn~=0.34.0"]) == []
+
+    def test_missing_or_outdated_requirements_are_kept(self):
+        assert pending_requirements(["fastapi>=0.116", "loguru~=0.7.3"]) == ["fastapi>=0.116", "loguru~=0.7.3"]
+
+    def test_requirement_with_false_marker_is_dropped(self):
+        assert pending_requirements(["loguru; python_version < '3.0'"]) == []
+
+    def test_requirement_with_true_marker_is_checked(self):
+        assert pending_requirements(["loguru; python_version >= '3.0'"]) == ["loguru; python_version >= '3.0'"]
+
+    def test_extras_are_always_kept(self):
+        assert pending_requirements(["uvicorn[standard]~=0.34.0"]) == ["uvicorn[standard]~=0.34.0"]
+
+    def test_urls_are_always_kept(self):
+        lines = ["fastapi @ git+https://github.com/fastapi/fastapi.git", "git+https://github.com/org/repo.git"]
+        assert pending_requirements(lines) == lines
+
+    def test_options_kept_only_with_pending_packages(self):
+        options = ["--extra-index-url https://example.com"]
+        assert pending_requirements([*options, "fastapi==0.115.9"]) == []
+        assert pending_requirements([*options, "loguru"]) == [*options, "loguru"]
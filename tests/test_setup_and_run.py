@@ -0,0 +1,114 @@
+"""
+Testes do script setup_and_run.py
+"""
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import setup_and_run
+from setup_and_run import OpenManusSetup
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    """OpenManusSetup com projeto e venv em um diretório temporário, sem executar subprocessos"""
+    monkeypatch.setattr(setup_and_run, "__file__", str(tmp_path / "setup_and_run.py"))
+    (tmp_path / "requirements.txt").write_text("fastapi\n", encoding="utf-8")
+    (tmp_path / ".venv").mkdir()
+
+    args = argparse.Namespace(backend_only=True, skip_tests=True, force_reinstall=False, embed=False)
+    instance = OpenManusSetup(args)
+    instance.uv = None
+    instance.python_executable = str(tmp_path / ".venv" / "bin" / "python")
+
+    instance.commands = []
+    instance.probed = []
+
+    def run_venv_command(command, **kwargs):
+        instance.commands.append(command)
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    def probe_imports(modules, **kwargs):
+        instance.probed.append(list(modules))
+        return dict.fromkeys(modules)
+
+    monkeypatch.setattr(instance, "run_venv_command", run_venv_command)
+    monkeypatch.setattr(instance, "probe_imports", probe_imports)
+    return instance
+
+
+class TestInstallDependencies:
+    """Testes do stamp de instalação das dependências Python"""
+
+    def test_pillow_is_probed_as_pil(self, setup):
+        assert setup.verify_python_packages()
+        assert "PIL" in setup.probed[0]
+        assert "pillow" not in setup.probed[0]
+
+    def test_stamp_written_after_successful_verify(self, setup):
+        setup.install_dependencies()
+
+        stamp_file = setup.venv_path / ".openmanus_stamp"
+        assert stamp_file.read_text(encoding="utf-8") == setup.dependencies_hash(
+            setup.project_root / "requirements.txt"
+        )
+
+    def test_second_run_skips_install(self, setup):
+        setup.install_dependencies()
+        assert len(setup.commands) == 1
+
+        setup.install_dependencies()
+        assert len(setup.commands) == 1
+        assert len(setup.probed) == 1
+
+    def test_stamp_not_written_when_package_missing(self, setup, monkeypatch):
+        monkeypatch.setattr(setup, "probe_imports", lambda modules, **kwargs: {m: "not found" for m in modules})
+
+        setup.install_dependencies()
+
+        assert not (setup.venv_path / ".openmanus_stamp").exists()
+
+
+class TestStartSystem:
+    """Testes da parada dos serviços ao sair de start_system"""
+
+    def test_backend_stopped_when_not_responding(self, setup, monkeypatch):
+        import signal
+
+        # Sem handlers globais instalados durante os testes
+        monkeypatch.setattr(signal, "signal", lambda *args: None)
+        monkeypatch.setattr(
+            setup,
+            "backend_command",
+            lambda: [sys.executable, "-u", "-c", "import time; print('Uvicorn running on'); time.sleep(60)"],
+        )
+        monkeypatch.setattr(setup, "check_backend_health", lambda: False)
+
+        setup.start_system()
+
+        backend = setup.services[0]
+        assert backend.process.poll() is not None
+
+
+class TestRun:
+    """Testes do encerramento do setup"""
+
+    def test_frontend_install_stopped_on_setup_exit(self, setup, monkeypatch):
+        install = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        monkeypatch.setattr(setup, "check_system_requirements", lambda: None)
+        monkeypatch.setattr(setup, "start_external_probes", lambda: None)
+        monkeypatch.setattr(setup, "setup_frontend", lambda: setattr(setup, "frontend_install", install))
+        monkeypatch.setattr(setup, "setup_python_environment", lambda: sys.exit(1))
+        setup.args.backend_only = False
+
+        with pytest.raises(SystemExit):
+            setup.run()
+
+        assert install.poll() is not None
@@ -0,0 +1,70 @@
+"""
+Unit tests for TOML loading in app.core.settings.
+
+Covers the parsed-file cache: a file is reparsed whenever its mtime or size
+changes, and callers always receive a private copy of the cached document.
+"""
+
+import os
+
+import pytest
+
+# Check dependencies early
+pytest.importorskip("pydantic_settings")
+
+# Application imports
+from app.core.settings import _parse_toml_file, _read_toml_file
+
+
+class TestReadTomlFile:
+    """Test cases for _read_toml_file caching."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty parse cache."""
+        _parse_toml_file.cache_clear()
+        yield
+        _parse_toml_file.cache_clear()
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert _read_toml_file(tmp_path / "missing.toml") is None
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[llm]\nmodel = "a"\n', encoding="utf-8")
+
+        assert _read_toml_file(path) == {"llm": {"model": "a"}}
+        assert _read_toml_file(path) == {"llm": {"model": "a"}}
+        assert _parse_toml_file.cache_info().misses == 1
+
+    def test_size_change_invalidates_cache(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[llm]\nmodel = "a"\n', encoding="utf-8")
+        stat = path.stat()
+        _read_toml_file(path)
+
+        path.write_text('[llm]\nmodel = "longer"\n', encoding="utf-8")
+        # Same mtime, so only the size tells the versions apart
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert _read_toml_file(path) == {"llm": {"model": "longer"}}
+
+    def test_mtime_change_invalidates_cache(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[llm]\nmodel = "a"\n', encoding="utf-8")
+        stat = path.stat()
+        _read_toml_file(path)
+
+        # Same size, so only the mtime tells the versions apart
+        path.write_text('[llm]\nmodel = "b"\n', encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert _read_toml_file(path) == {"llm": {"model": "b"}}
+
+    def test_returns_private_copy(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[llm]\nmodel = "a"\n', encoding="utf-8")
+
+        _read_toml_file(path)["llm"]["model"] = "mutated"
+
+        assert _read_toml_file(path) == {"llm": {"model": "a"}}